@@ -9,16 +9,29 @@ use network_monitor_common::{
     EbpfEvent, TcpAcceptEvent, TcpCloseEvent, TcpConnectEvent, AF_INET, AF_INET6,
     EVENT_TYPE_ACCEPT, EVENT_TYPE_CLOSE, EVENT_TYPE_CONNECT,
 };
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
+use std::fs::File;
 use std::mem;
+use std::net::{IpAddr, Ipv4Addr, Ipv6Addr, SocketAddr};
+use std::os::unix::ffi::OsStrExt;
+use std::os::unix::fs::FileExt;
+use std::path::Path;
 use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{Arc, Mutex};
 use std::thread;
 use std::time::{Duration, Instant};
 
+/// Pause between perf buffer polls while events are arriving
+const READER_MIN_SLEEP: Duration = Duration::from_millis(5);
+/// Longest pause the reader backs off to when no events arrive; kept short
+/// so a burst after an idle spell is drained before the buffers overrun
+const READER_MAX_SLEEP: Duration = Duration::from_millis(20);
+
 struct ConnectionState {
     connection: Connection,
     last_seen: Instant,
+    /// Start time of the owning process, if it was visible under `/proc`
+    start_time: Option<u64>,
 }
 
 pub struct EbpfMonitor {
@@ -27,6 +40,7 @@ pub struct EbpfMonitor {
     connections: Arc<Mutex<HashMap<u64, ConnectionState>>>,
     stopped: Arc<AtomicBool>,
     last_update_time: std::cell::RefCell<Instant>,
+    io_reader: std::cell::RefCell<ProcessIoReader>,
 }
 
 impl EbpfMonitor {
@@ -117,10 +131,17 @@ impl EbpfMonitor {
         let connections: Arc<Mutex<HashMap<u64, ConnectionState>>> =
             Arc::new(Mutex::new(HashMap::new()));
         let stopped = Arc::new(AtomicBool::new(false));
-
-        let reader_handle =
-            Self::start_event_reader(&mut bpf, connections.clone(), stopped.clone());
-        Self::rehydrate(&connections);
+        // Rehydration warms the same cache the event reader uses, so events
+        // from processes found at startup skip the cmdline read
+        let processes = Arc::new(Mutex::new(ProcessCache::default()));
+
+        let reader_handle = Self::start_event_reader(
+            &mut bpf,
+            connections.clone(),
+            processes.clone(),
+            stopped.clone(),
+        );
+        Self::rehydrate(&connections, &processes);
 
         Ok(Self {
             _bpf: Some(bpf),
@@ -128,12 +149,14 @@ impl EbpfMonitor {
             connections,
             stopped,
             last_update_time: std::cell::RefCell::new(Instant::now()),
+            io_reader: std::cell::RefCell::new(ProcessIoReader::default()),
         })
     }
 
     fn start_event_reader(
         bpf: &mut aya::Ebpf,
         connections: Arc<Mutex<HashMap<u64, ConnectionState>>>,
+        processes: Arc<Mutex<ProcessCache>>,
         stopped: Arc<AtomicBool>,
     ) -> Option<thread::JoinHandle<()>> {
         let map = match bpf.take_map("EVENTS") {
@@ -180,33 +203,50 @@ impl EbpfMonitor {
         let handle = thread::Builder::new()
             .name("ebpf-event-reader".into())
             .spawn(move || {
+                let mut sleep = READER_MIN_SLEEP;
+                let mut total_lost = 0;
                 while !stopped.load(Ordering::Relaxed) {
+                    let mut samples = 0usize;
+                    let mut lost = 0;
                     for (_cpu_id, buf) in &mut buffers {
-                        buf.for_each(|event: PerfEvent<'_>| match event {
-                            PerfEvent::Sample { head, tail } => {
-                                let data = if tail.is_empty() {
-                                    head.to_vec()
-                                } else {
-                                    let mut v = Vec::with_capacity(head.len() + tail.len());
-                                    v.extend_from_slice(head);
-                                    v.extend_from_slice(tail);
-                                    v
-                                };
-                                Self::process_events(&data, &connections);
-                            }
-                            PerfEvent::Lost { count } => {
-                                eprintln!("Lost {count} perf events");
+                        buf.for_each(|event: PerfEvent<'_>| {
+                            match event {
+                                // Only records that wrap the ring need copying
+                                PerfEvent::Sample { head, tail: [] } => {
+                                    samples += 1;
+                                    Self::process_events(head, &connections, &processes);
+                                }
+                                PerfEvent::Sample { head, tail } => {
+                                    samples += 1;
+                                    let mut data = Vec::with_capacity(head.len() + tail.len());
+                                    data.extend_from_slice(head);
+                                    data.extend_from_slice(tail);
+                                    Self::process_events(&data, &connections, &processes);
+                                }
+                                PerfEvent::Lost { count } => {
+                                    lost += count;
+                                }
                             }
                         });
                     }
-                    thread::sleep(Duration::from_millis(5));
+
+                    if lost > 0 {
+                        total_lost += lost;
+                        eprintln!("Lost {lost} perf events ({total_lost} since start)");
+                    }
+                    sleep = next_reader_sleep(sleep, samples, lost > 0);
+                    thread::sleep(sleep);
                 }
             })
             .expect("Failed to spawn event reader thread");
         Some(handle)
     }
 
-    fn process_events(data: &[u8], connections: &Arc<Mutex<HashMap<u64, ConnectionState>>>) {
+    fn process_events(
+        data: &[u8],
+        connections: &Arc<Mutex<HashMap<u64, ConnectionState>>>,
+        processes: &Mutex<ProcessCache>,
+    ) {
         let event_size = mem::size_of::<EbpfEvent>();
         if data.len() < event_size {
             return;
@@ -214,62 +254,82 @@ impl EbpfMonitor {
         let event: EbpfEvent = unsafe { (data.as_ptr() as *const EbpfEvent).read_unaligned() };
         let now = Instant::now();
 
-        let mut guard = match connections.lock() {
-            Ok(g) => g,
-            Err(_) => return,
-        };
-
-        match event.event_type {
+        // Resolve process details before taking the lock so /proc reads do
+        // not stall get_connections() on the UI side. The cache lock is
+        // released before the connection table is locked.
+        let mut processes = processes.lock().unwrap_or_else(|e| e.into_inner());
+        let update = match event.event_type {
             EVENT_TYPE_CONNECT => {
                 let ev: TcpConnectEvent = unsafe { event.data.connect };
-                guard.insert(
+                Some((
                     sock_key(ev.pid, ev.dport as u64),
-                    ConnectionState {
-                        connection: connection_from_connect(&ev),
-                        last_seen: now,
-                    },
-                );
+                    Some(connection_from_connect(&ev, &mut processes, now)),
+                ))
             }
             EVENT_TYPE_ACCEPT => {
                 let ev: TcpAcceptEvent = unsafe { event.data.accept };
-                guard.insert(
+                Some((
                     sock_key(ev.pid, ev.dport as u64),
-                    ConnectionState {
-                        connection: connection_from_accept(&ev),
-                        last_seen: now,
-                    },
-                );
+                    Some(connection_from_accept(&ev, &mut processes, now)),
+                ))
             }
             EVENT_TYPE_CLOSE => {
                 let ev: TcpCloseEvent = unsafe { event.data.close };
-                let key = sock_key(ev.pid, ev.dport as u64);
+                Some((sock_key(ev.pid, ev.dport as u64), None))
+            }
+            _ => None,
+        };
+        drop(processes);
+        let Some((key, connection)) = update else {
+            return;
+        };
+
+        let mut guard = match connections.lock() {
+            Ok(g) => g,
+            Err(_) => return,
+        };
+        match connection {
+            Some(state) => {
+                guard.insert(key, state);
+            }
+            None => {
                 guard.remove(&key);
             }
-            _ => {}
         }
     }
 
-    fn rehydrate(connections: &Arc<Mutex<HashMap<u64, ConnectionState>>>) {
+    fn rehydrate(
+        connections: &Arc<Mutex<HashMap<u64, ConnectionState>>>,
+        processes: &Mutex<ProcessCache>,
+    ) {
+        // The event reader is already running. Hold the table for the whole
+        // scan so a close arriving mid-scan is applied after the insert
+        // instead of being lost and leaving a ghost entry behind.
         let now = Instant::now();
         let mut guard = match connections.lock() {
             Ok(g) => g,
             Err(_) => return,
         };
 
-        let entries = parse_proc_net_tcp("/proc/net/tcp", "tcp", AF_INET);
-        let entries_v6 = parse_proc_net_tcp("/proc/net/tcp6", "tcp6", AF_INET6);
-
-        let pid_map = build_pid_map();
-
-        for entry in entries.into_iter().chain(entries_v6) {
-            let pid = pid_map.get(&entry.inode).cloned();
-            let (program, command) = if let Some(ref pid_str) = pid {
-                (get_process_name(pid_str), get_process_cmdline(pid_str))
-            } else {
-                ("N/A".to_string(), String::new())
+        let mut entries = Vec::new();
+        for (path, protocol, family) in PROC_NET_TABLES {
+            entries.extend(parse_proc_net_tcp(path, protocol, family));
+        }
+        let wanted: HashSet<u64> = entries.iter().map(|entry| entry.inode).collect();
+        let pid_map = build_pid_map(&wanted);
+        // Processes usually own several sockets; the cache reads each one's
+        // command line only once. The reader never holds this lock while
+        // waiting for the connection table, so the nesting cannot deadlock.
+        let mut processes = processes.lock().unwrap_or_else(|e| e.into_inner());
+
+        for entry in entries {
+            let pid = pid_map.get(&entry.inode).map(String::as_str);
+            let info = match pid {
+                Some(pid_str) => processes.get(pid_str),
+                None => ProcessInfo::unknown(),
             };
 
-            let key = if let Some(ref pid_str) = pid {
+            let key = if let Some(pid_str) = pid {
                 if let Ok(pid_num) = pid_str.parse::<u32>() {
                     sock_key(pid_num, entry.remote_port as u64)
                 } else {
@@ -287,39 +347,18 @@ impl EbpfMonitor {
                         state: entry.state,
                         local: entry.local,
                         remote: entry.remote,
-                        program,
-                        pid: pid.unwrap_or_else(|| "N/A".to_string()),
-                        command,
+                        program: info.name,
+                        pid: pid.unwrap_or("N/A").to_string(),
+                        command: info.cmdline,
                         rx_rate: 0,
                         tx_rate: 0,
                     },
                     last_seen: now,
+                    start_time: info.start_time,
                 },
             );
         }
     }
-
-    fn get_process_io_inner(pid: &str) -> ProcessIO {
-        let io_path = format!("/proc/{pid}/io");
-        if let Ok(io_data) = std::fs::read_to_string(&io_path) {
-            let mut rx_bytes = 0u64;
-            let mut tx_bytes = 0u64;
-            for line in io_data.lines() {
-                if line.starts_with("rchar:") {
-                    if let Some(value) = line.split_whitespace().nth(1) {
-                        rx_bytes = value.parse().unwrap_or(0);
-                    }
-                } else if line.starts_with("wchar:") {
-                    if let Some(value) = line.split_whitespace().nth(1) {
-                        tx_bytes = value.parse().unwrap_or(0);
-                    }
-                }
-            }
-            ProcessIO::new(rx_bytes, tx_bytes)
-        } else {
-            ProcessIO::zero()
-        }
-    }
 }
 
 impl ConnectionMonitor for EbpfMonitor {
@@ -330,6 +369,7 @@ impl ConnectionMonitor for EbpfMonitor {
             .map_err(|e| NetworkMonitorError::MutexPoison(format!("{e}")))?;
         let now = Instant::now();
         cache.retain(|_, cs| now.duration_since(cs.last_seen) < Duration::from_secs(60));
+        prune_exited(&mut cache, process_start_time);
         let mut result: Vec<Connection> = cache
             .values_mut()
             .map(|cs| {
@@ -343,7 +383,7 @@ impl ConnectionMonitor for EbpfMonitor {
 
     #[allow(dead_code)]
     fn get_process_io(&self, pid: &str) -> ProcessIO {
-        Self::get_process_io_inner(pid)
+        self.io_reader.borrow_mut().read(pid)
     }
 
     fn update_connection_rates(
@@ -351,8 +391,7 @@ impl ConnectionMonitor for EbpfMonitor {
         connections: Vec<Connection>,
         prev_io: &HashMap<String, ProcessIO>,
     ) -> Result<(Vec<Connection>, HashMap<String, ProcessIO>)> {
-        let mut current_io = HashMap::new();
-        let mut updated_connections = Vec::new();
+        let mut updated_connections = Vec::with_capacity(connections.len());
         let now = Instant::now();
         let elapsed_seconds = {
             let last_time = *self.last_update_time.borrow();
@@ -361,15 +400,21 @@ impl ConnectionMonitor for EbpfMonitor {
             elapsed.as_secs_f64().max(0.001)
         };
 
+        let current_io = self.io_reader.borrow_mut().read_batch(
+            connections
+                .iter()
+                .filter(|conn| samples_io(conn))
+                .map(|conn| conn.pid.as_str()),
+        );
+
         for mut conn in connections {
-            if conn.pid != "N/A" {
-                let io = Self::get_process_io_inner(&conn.pid);
-                let pid_key = conn.pid.clone();
-                if let Some(prev) = prev_io.get(&pid_key) {
-                    conn.rx_rate = (io.rx.saturating_sub(prev.rx) as f64 / elapsed_seconds) as u64;
-                    conn.tx_rate = (io.tx.saturating_sub(prev.tx) as f64 / elapsed_seconds) as u64;
-                }
-                current_io.insert(pid_key, io);
+            if !samples_io(&conn) {
+                updated_connections.push(conn);
+                continue;
+            }
+            if let (Some(io), Some(prev)) = (current_io.get(&conn.pid), prev_io.get(&conn.pid)) {
+                conn.rx_rate = (io.rx.saturating_sub(prev.rx) as f64 / elapsed_seconds) as u64;
+                conn.tx_rate = (io.tx.saturating_sub(prev.tx) as f64 / elapsed_seconds) as u64;
             }
             updated_connections.push(conn);
         }
@@ -391,70 +436,147 @@ impl Drop for EbpfMonitor {
     }
 }
 
+/// Pause before the next perf buffer poll.
+///
+/// Polls quickly while connections are changing and backs off towards
+/// `READER_MAX_SLEEP` while the system is quiet. Lost records mean the
+/// buffers overran, so polling returns to the fastest rate right away.
+fn next_reader_sleep(sleep: Duration, samples: usize, lost: bool) -> Duration {
+    if samples > 0 || lost {
+        READER_MIN_SLEEP
+    } else {
+        (sleep * 2).min(READER_MAX_SLEEP)
+    }
+}
+
+/// Drop connections whose process has exited.
+///
+/// Close events can be lost when a perf buffer overruns, and polled entries
+/// never age out, so without this such connections would be listed forever.
+/// Each distinct process is checked once however many sockets it had, and
+/// counts as exited when its pid is gone or now has a different start time.
+///
+/// Only connections whose process was visible under `/proc` when they were
+/// added carry a start time and are checked. With `hidepid` or a separate
+/// pid namespace another user's process is never visible, and its absence
+/// says nothing about whether it exited.
+fn prune_exited(
+    connections: &mut HashMap<u64, ConnectionState>,
+    start_time: impl Fn(&str) -> Option<u64>,
+) {
+    let exited: Vec<u64> = {
+        let mut alive: HashMap<(&str, u64), bool> = HashMap::new();
+        connections
+            .iter()
+            .filter_map(|(key, cs)| {
+                let started = cs.start_time?;
+                let pid = cs.connection.pid.as_str();
+                let live = *alive
+                    .entry((pid, started))
+                    .or_insert_with(|| start_time(pid) == Some(started));
+                (!live).then_some(*key)
+            })
+            .collect()
+    };
+    for key in exited {
+        connections.remove(&key);
+    }
+}
+
 fn sock_key(pid: u32, dport: u64) -> u64 {
     (pid as u64) << 32 | dport
 }
 
+/// Whether a connection's process I/O is sampled for rates.
+///
+/// Listening sockets carry no traffic of their own, so they keep zero
+/// rates and a process that only listens is never read at all.
+fn samples_io(conn: &Connection) -> bool {
+    conn.pid != "N/A" && conn.state != "LISTEN"
+}
+
+/// Format an address from an eBPF event the same way rehydrated `/proc/net`
+/// entries are, so both sources produce identical (compressed) IPv6 text.
 fn sock_addr_to_string(addr: &[u8; 16], family: u16, port: u16) -> String {
-    if family == AF_INET6 {
-        let segments: Vec<String> = addr
-            .chunks(2)
-            .map(|c| u16::from_be_bytes([c[0], c[1]]))
-            .map(|s| format!("{s:x}"))
-            .collect();
-        format!("[{}]:{port}", segments.join(":"))
+    let ip = if family == AF_INET6 {
+        IpAddr::V6(Ipv6Addr::from(*addr))
     } else {
-        let ip = format!("{}.{}.{}.{}", addr[12], addr[13], addr[14], addr[15]);
-        format!("{ip}:{port}")
-    }
+        IpAddr::V4(Ipv4Addr::new(addr[12], addr[13], addr[14], addr[15]))
+    };
+    SocketAddr::new(ip, port).to_string()
 }
 
-fn tcp_state_string(state: u8) -> String {
-    match state {
-        1 => "ESTABLISHED".to_string(),
-        2 => "SYN_SENT".to_string(),
-        3 => "SYN_RECV".to_string(),
-        4 => "FIN_WAIT1".to_string(),
-        5 => "FIN_WAIT2".to_string(),
-        6 => "TIME_WAIT".to_string(),
-        7 => "CLOSE".to_string(),
-        8 => "CLOSE_WAIT".to_string(),
-        9 => "LAST_ACK".to_string(),
-        10 => "LISTEN".to_string(),
-        11 => "CLOSING".to_string(),
-        _ => "UNKNOWN".to_string(),
-    }
+/// Kernel TCP states (`include/net/tcp_states.h`), indexed by the `st`
+/// column of `/proc/net/tcp`
+const TCP_STATES: [&str; 12] = [
+    "UNKNOWN",
+    "ESTABLISHED",
+    "SYN_SENT",
+    "SYN_RECV",
+    "FIN_WAIT1",
+    "FIN_WAIT2",
+    "TIME_WAIT",
+    "CLOSE",
+    "CLOSE_WAIT",
+    "LAST_ACK",
+    "LISTEN",
+    "CLOSING",
+];
+
+fn tcp_state_string(state: u8) -> &'static str {
+    TCP_STATES
+        .get(state as usize)
+        .copied()
+        .unwrap_or(TCP_STATES[0])
 }
 
-fn connection_from_connect(ev: &TcpConnectEvent) -> Connection {
+fn connection_from_connect(
+    ev: &TcpConnectEvent,
+    processes: &mut ProcessCache,
+    now: Instant,
+) -> ConnectionState {
     let protocol = if ev.family == AF_INET6 { "tcp6" } else { "tcp" };
     let pid_str = ev.pid.to_string();
-    Connection {
-        protocol: protocol.to_string(),
-        state: "ESTABLISHED".to_string(),
-        local: sock_addr_to_string(&ev.saddr, ev.family, ev.sport),
-        remote: sock_addr_to_string(&ev.daddr, ev.family, ev.dport),
-        program: get_process_name(&pid_str),
-        pid: pid_str.clone(),
-        command: get_process_cmdline(&pid_str),
-        rx_rate: 0,
-        tx_rate: 0,
+    let info = processes.get(&pid_str);
+    ConnectionState {
+        connection: Connection {
+            protocol: protocol.to_string(),
+            state: "ESTABLISHED".to_string(),
+            local: sock_addr_to_string(&ev.saddr, ev.family, ev.sport),
+            remote: sock_addr_to_string(&ev.daddr, ev.family, ev.dport),
+            program: info.name,
+            pid: pid_str,
+            command: info.cmdline,
+            rx_rate: 0,
+            tx_rate: 0,
+        },
+        last_seen: now,
+        start_time: info.start_time,
     }
 }
 
-fn connection_from_accept(ev: &TcpAcceptEvent) -> Connection {
+fn connection_from_accept(
+    ev: &TcpAcceptEvent,
+    processes: &mut ProcessCache,
+    now: Instant,
+) -> ConnectionState {
     let protocol = if ev.family == AF_INET6 { "tcp6" } else { "tcp" };
     let pid_str = ev.pid.to_string();
-    Connection {
-        protocol: protocol.to_string(),
-        state: "ESTABLISHED".to_string(),
-        local: sock_addr_to_string(&ev.saddr, ev.family, ev.sport),
-        remote: sock_addr_to_string(&ev.daddr, ev.family, ev.dport),
-        program: get_process_name(&pid_str),
-        pid: pid_str.clone(),
-        command: get_process_cmdline(&pid_str),
-        rx_rate: 0,
-        tx_rate: 0,
+    let info = processes.get(&pid_str);
+    ConnectionState {
+        connection: Connection {
+            protocol: protocol.to_string(),
+            state: "ESTABLISHED".to_string(),
+            local: sock_addr_to_string(&ev.saddr, ev.family, ev.sport),
+            remote: sock_addr_to_string(&ev.daddr, ev.family, ev.dport),
+            program: info.name,
+            pid: pid_str,
+            command: info.cmdline,
+            rx_rate: 0,
+            tx_rate: 0,
+        },
+        last_seen: now,
+        start_time: info.start_time,
     }
 }
 
@@ -473,6 +595,15 @@ fn has_effective_cap(cap_mask: u64) -> bool {
     false
 }
 
+/// `/proc/net` tables read on startup, with their protocol label and family.
+///
+/// Only TCP is listed: the probes trace TCP connect/accept, so UDP sockets
+/// would never be refreshed or expired by events.
+const PROC_NET_TABLES: [(&str, &str, u16); 2] = [
+    ("/proc/net/tcp", "tcp", AF_INET),
+    ("/proc/net/tcp6", "tcp6", AF_INET6),
+];
+
 struct ProcNetEntry {
     inode: u64,
     protocol: String,
@@ -483,99 +614,192 @@ struct ProcNetEntry {
 }
 
 fn parse_proc_net_tcp(path: &str, protocol: &str, family: u16) -> Vec<ProcNetEntry> {
-    let content = match std::fs::read_to_string(path) {
-        Ok(c) => c,
-        Err(_) => return Vec::new(),
-    };
+    match std::fs::read_to_string(path) {
+        Ok(content) => parse_proc_net_content(&content, protocol, family),
+        Err(_) => Vec::new(),
+    }
+}
 
+/// Parse the body of a `/proc/net/{tcp,tcp6}` table.
+///
+/// Columns are fixed (`sl local_address rem_address st tx:rx tr:tm retrnsmt
+/// uid timeout inode ...`), so only the fields we need are pulled off the
+/// whitespace iterator instead of collecting every column of every row.
+fn parse_proc_net_content(content: &str, protocol: &str, family: u16) -> Vec<ProcNetEntry> {
     let mut entries = Vec::new();
     for line in content.lines().skip(1) {
-        let parts: Vec<&str> = line.split_whitespace().collect();
-        if parts.len() < 10 {
+        let mut fields = line.split_whitespace();
+        let (Some(_sl), Some(local), Some(remote), Some(state_hex), Some(inode_str)) = (
+            fields.next(),
+            fields.next(),
+            fields.next(),
+            fields.next(),
+            fields.nth(5),
+        ) else {
             continue;
-        }
-
-        let local = parts[1];
-        let remote = parts[2];
-        let state_hex = parts[3];
-        let inode_str = parts[9];
+        };
 
-        let state_num = u8::from_str_radix(state_hex, 16).unwrap_or(0);
-        let state = tcp_state_string(state_num);
         let inode: u64 = inode_str.parse().unwrap_or(0);
         if inode == 0 {
             continue;
         }
+        let state_num = u8::from_str_radix(state_hex, 16).unwrap_or(0);
 
-        let (local_ip_hex, local_port_hex) = local.split_once(':').unwrap_or(("", "0"));
-        let (remote_ip_hex, remote_port_hex) = remote.split_once(':').unwrap_or(("", "0"));
-
-        let local_ip = format_ip_from_hex(local_ip_hex, family);
-        let remote_ip = format_ip_from_hex(remote_ip_hex, family);
-        let local_port = u16::from_str_radix(local_port_hex, 16).unwrap_or(0);
-        let remote_port = u16::from_str_radix(remote_port_hex, 16).unwrap_or(0);
-
-        let local = if family == AF_INET6 {
-            format!("[{local_ip}]:{local_port}")
-        } else {
-            format!("{local_ip}:{local_port}")
-        };
-        let remote = if family == AF_INET6 {
-            format!("[{remote_ip}]:{remote_port}")
-        } else {
-            format!("{remote_ip}:{remote_port}")
+        let (Some(local), Some(remote)) = (
+            parse_hex_socket_addr(local, family),
+            parse_hex_socket_addr(remote, family),
+        ) else {
+            continue;
         };
 
         entries.push(ProcNetEntry {
             inode,
             protocol: protocol.to_string(),
-            local,
-            remote,
-            remote_port,
-            state,
+            local: local.to_string(),
+            remote: remote.to_string(),
+            remote_port: remote.port(),
+            state: tcp_state_string(state_num).to_string(),
         });
     }
     entries
 }
 
-fn format_ip_from_hex(hex: &str, family: u16) -> String {
+/// Decode a `/proc/net` `ADDR:PORT` pair.
+///
+/// The kernel prints addresses as native-endian 32-bit words, so each word
+/// is parsed as a `u32` and unpacked with `to_ne_bytes()` to recover the
+/// network byte order.
+fn parse_hex_socket_addr(field: &str, family: u16) -> Option<SocketAddr> {
+    let (ip_hex, port_hex) = field.split_once(':')?;
+    let ip = format_ip_from_hex(ip_hex, family)?;
+    let port = u16::from_str_radix(port_hex, 16).ok()?;
+    Some(SocketAddr::new(ip, port))
+}
+
+fn format_ip_from_hex(hex: &str, family: u16) -> Option<IpAddr> {
     if family == AF_INET6 {
-        let padded = format!("{:0>32}", hex);
-        let segments: Vec<String> = (0..8)
-            .map(|i| {
-                let s = u16::from_str_radix(&padded[i * 4..i * 4 + 4], 16).unwrap_or(0);
-                format!("{s:x}")
-            })
-            .collect();
-        segments.join(":")
+        if hex.len() != 32 {
+            return None;
+        }
+        let mut octets = [0u8; 16];
+        for (i, chunk) in octets.chunks_exact_mut(4).enumerate() {
+            let word = u32::from_str_radix(hex.get(i * 8..i * 8 + 8)?, 16).ok()?;
+            chunk.copy_from_slice(&word.to_ne_bytes());
+        }
+        Some(IpAddr::V6(Ipv6Addr::from(octets)))
     } else {
-        let padded = format!("{:0>8}", hex);
-        let octets: Vec<String> = (0..4)
-            .map(|i| {
-                u8::from_str_radix(&padded[i * 2..i * 2 + 2], 16)
-                    .unwrap_or(0)
-                    .to_string()
-            })
-            .collect();
-        octets.join(".")
+        let word = u32::from_str_radix(hex, 16).ok()?;
+        Some(IpAddr::V4(Ipv4Addr::from(word.to_ne_bytes())))
     }
 }
 
-fn build_pid_map() -> HashMap<u64, String> {
+/// Reads `/proc/[pid]/io` through handles kept open across refresh cycles.
+///
+/// procfs regenerates the file on every read from offset 0, so a `pread`
+/// on the existing handle replaces an open/read/close per pid per tick.
+#[derive(Default)]
+struct ProcessIoReader {
+    files: HashMap<String, File>,
+}
+
+impl ProcessIoReader {
+    /// Sample each distinct pid once for the whole refresh cycle, however
+    /// many connections each process owns. Handles for pids that are no
+    /// longer requested are closed.
+    fn read_batch<'a>(
+        &mut self,
+        pids: impl IntoIterator<Item = &'a str>,
+    ) -> HashMap<String, ProcessIO> {
+        let mut batch = HashMap::new();
+        for pid in pids {
+            if !batch.contains_key(pid) {
+                let io = self.read(pid);
+                batch.insert(pid.to_string(), io);
+            }
+        }
+        self.files.retain(|pid, _| batch.contains_key(pid));
+        batch
+    }
+
+    fn read(&mut self, pid: &str) -> ProcessIO {
+        // A handle fails once its process exits; reopen once in case the
+        // pid now belongs to a new process.
+        for _ in 0..2 {
+            if !self.files.contains_key(pid) {
+                match File::open(format!("/proc/{pid}/io")) {
+                    Ok(file) => self.files.insert(pid.to_string(), file),
+                    Err(_) => return ProcessIO::zero(),
+                };
+            }
+
+            let mut buf = [0u8; 512];
+            match self.files[pid].read_at(&mut buf, 0) {
+                Ok(len) => return parse_process_io(&buf[..len]),
+                Err(_) => {
+                    self.files.remove(pid);
+                }
+            }
+        }
+        ProcessIO::zero()
+    }
+}
+
+/// `rchar`/`wchar` from the raw contents of `/proc/[pid]/io`.
+///
+/// Lines are borrowed slices of the read buffer, so nothing is decoded or
+/// allocated. The kernel prints `rchar` and `wchar` first, so the scan
+/// stops as soon as both have been seen.
+fn parse_process_io(io_data: &[u8]) -> ProcessIO {
+    let mut rx_bytes = None;
+    let mut tx_bytes = None;
+    for line in io_data.split(|&b| b == b'\n') {
+        if let Some(value) = line.strip_prefix(b"rchar:") {
+            rx_bytes = Some(parse_io_counter(value).unwrap_or(0));
+        } else if let Some(value) = line.strip_prefix(b"wchar:") {
+            tx_bytes = Some(parse_io_counter(value).unwrap_or(0));
+        }
+        if rx_bytes.is_some() && tx_bytes.is_some() {
+            break;
+        }
+    }
+    ProcessIO::new(rx_bytes.unwrap_or(0), tx_bytes.unwrap_or(0))
+}
+
+/// Decimal counter accumulated straight from the ASCII digits
+fn parse_io_counter(value: &[u8]) -> Option<u64> {
+    let digits = value.trim_ascii();
+    if digits.is_empty() {
+        return None;
+    }
+    digits.iter().try_fold(0u64, |acc, &b| {
+        if !b.is_ascii_digit() {
+            return None;
+        }
+        acc.checked_mul(10)?.checked_add(u64::from(b - b'0'))
+    })
+}
+
+/// Map socket inodes to their owning pid with a single walk of `/proc/*/fd`.
+///
+/// Only inodes in `wanted` are recorded and the walk stops as soon as all of
+/// them are found. Inode 0 (sockets in TIME_WAIT) has no owner to find.
+fn build_pid_map(wanted: &HashSet<u64>) -> HashMap<u64, String> {
     let mut pid_map = HashMap::new();
+    let remaining = wanted.iter().filter(|&&inode| inode != 0).count();
+    if remaining == 0 {
+        return pid_map;
+    }
     let proc = match std::fs::read_dir("/proc") {
         Ok(p) => p,
         Err(_) => return pid_map,
     };
 
     for entry in proc.flatten() {
-        let pid_str = match entry.file_name().to_str() {
-            Some(s) => s.to_string(),
-            None => continue,
+        let file_name = entry.file_name();
+        let pid_str = match file_name.to_str() {
+            Some(s) if s.bytes().all(|b| b.is_ascii_digit()) => s,
+            _ => continue,
         };
-        if !pid_str.chars().all(|c| c.is_ascii_digit()) {
-            continue;
-        }
 
         let fd_dir = format!("/proc/{pid_str}/fd");
         let fd_entries = match std::fs::read_dir(&fd_dir) {
@@ -588,30 +812,126 @@ fn build_pid_map() -> HashMap<u64, String> {
                 Ok(l) => l,
                 Err(_) => continue,
             };
-            let link_str = link.to_string_lossy().to_string();
-            if !link_str.starts_with("socket:[") {
-                continue;
+            match parse_socket_inode(&link) {
+                Some(inode) if inode != 0 && wanted.contains(&inode) => {
+                    pid_map.entry(inode).or_insert_with(|| pid_str.to_string());
+                }
+                _ => continue,
             }
-            let inode_part = link_str.trim_start_matches("socket:[");
-            let inode_part = inode_part.trim_end_matches(']');
-            if let Ok(inode) = inode_part.parse::<u64>() {
-                pid_map.entry(inode).or_insert_with(|| pid_str.clone());
+            if pid_map.len() == remaining {
+                return pid_map;
             }
         }
     }
     pid_map
 }
 
-fn get_process_name(pid: &str) -> String {
-    let status_path = format!("/proc/{pid}/status");
-    if let Ok(content) = std::fs::read_to_string(&status_path) {
-        for line in content.lines() {
-            if line.starts_with("Name:\t") {
-                return line.strip_prefix("Name:\t").unwrap_or("N/A").to_string();
+/// Extract the inode from an fd link target of the form `socket:[12345]`.
+///
+/// Works on the raw bytes so non-socket links (files, pipes, anon inodes)
+/// are rejected without building an owned string for each one.
+fn parse_socket_inode(link: &Path) -> Option<u64> {
+    let digits = link
+        .as_os_str()
+        .as_bytes()
+        .strip_prefix(b"socket:[")?
+        .strip_suffix(b"]")?;
+    std::str::from_utf8(digits).ok()?.parse().ok()
+}
+
+/// Name, command line and start time of a process.
+#[derive(Clone)]
+struct ProcessInfo {
+    name: String,
+    cmdline: String,
+    /// `None` when `/proc/[pid]/stat` could not be read
+    start_time: Option<u64>,
+}
+
+impl ProcessInfo {
+    fn unknown() -> Self {
+        Self {
+            name: "N/A".to_string(),
+            cmdline: String::new(),
+            start_time: None,
+        }
+    }
+}
+
+/// Process details keyed by pid and validated against the process start time,
+/// so a recycled pid never reports the previous owner's details.
+///
+/// `/proc/[pid]/stat` carries both the start time and the process name, so a
+/// cache hit costs one read and a miss adds only `/proc/[pid]/cmdline`.
+///
+/// One instance is shared by rehydration and the event reader thread.
+#[derive(Default)]
+struct ProcessCache {
+    entries: HashMap<String, (u64, ProcessInfo)>,
+    /// Size at which the next sweep runs; 0 until the first sweep
+    prune_at: usize,
+}
+
+impl ProcessCache {
+    /// Entry count above which exited processes are swept out.
+    const PRUNE_THRESHOLD: usize = 512;
+
+    fn get(&mut self, pid: &str) -> ProcessInfo {
+        let Some(stat) = read_process_stat(pid) else {
+            self.entries.remove(pid);
+            return ProcessInfo::unknown();
+        };
+        let Some((start_time, name)) = parse_stat(&stat) else {
+            return ProcessInfo::unknown();
+        };
+        if let Some((cached_start, info)) = self.entries.get(pid) {
+            if *cached_start == start_time {
+                return info.clone();
             }
         }
+
+        if self.entries.len() >= self.prune_at.max(Self::PRUNE_THRESHOLD) {
+            self.prune();
+        }
+        let info = ProcessInfo {
+            name: name.to_string(),
+            cmdline: get_process_cmdline(pid),
+            start_time: Some(start_time),
+        };
+        self.entries
+            .insert(pid.to_string(), (start_time, info.clone()));
+        info
+    }
+
+    /// Drop exited processes, then wait for the cache to double before the
+    /// next sweep, so a host with many live processes pays an amortized
+    /// O(1) per miss instead of a full sweep every time.
+    fn prune(&mut self) {
+        self.entries
+            .retain(|pid, (start_time, _)| process_start_time(pid) == Some(*start_time));
+        self.prune_at = self.entries.len() * 2;
     }
-    "N/A".to_string()
+}
+
+fn read_process_stat(pid: &str) -> Option<String> {
+    std::fs::read_to_string(format!("/proc/{pid}/stat")).ok()
+}
+
+/// Current start time of `pid`, or `None` if it has exited or is not visible.
+fn process_start_time(pid: &str) -> Option<u64> {
+    read_process_stat(pid).and_then(|stat| parse_stat(&stat).map(|(start, _)| start))
+}
+
+/// Start time (clock ticks since boot, field 22) and `comm` (field 2) from
+/// the contents of `/proc/[pid]/stat`.
+fn parse_stat(stat: &str) -> Option<(u64, &str)> {
+    // `comm` may contain spaces and parentheses, so it spans from the first
+    // '(' to the last ')'. The next field is 3 (`state`), making starttime
+    // the 20th field after it.
+    let (head, rest) = stat.rsplit_once(')')?;
+    let (_, name) = head.split_once('(')?;
+    let start_time = rest.split_whitespace().nth(19)?.parse().ok()?;
+    Some((start_time, name))
 }
 
 fn get_process_cmdline(pid: &str) -> String {
@@ -649,6 +969,7 @@ mod tests {
                         tx_rate: 0,
                     },
                     last_seen: Instant::now() - Duration::from_secs(90),
+                    start_time: None,
                 },
             );
             map.insert(
@@ -666,6 +987,7 @@ mod tests {
                         tx_rate: 0,
                     },
                     last_seen: Instant::now() - Duration::from_secs(30),
+                    start_time: None,
                 },
             );
         }
@@ -704,4 +1026,273 @@ mod tests {
             );
         }
     }
+
+    #[test]
+    fn test_format_ip_from_hex_uses_host_byte_order() {
+        assert_eq!(
+            format_ip_from_hex("0100007F", AF_INET),
+            Some("127.0.0.1".parse().unwrap())
+        );
+        assert_eq!(
+            format_ip_from_hex("00000000000000000000000001000000", AF_INET6),
+            Some("::1".parse().unwrap())
+        );
+        assert_eq!(format_ip_from_hex("zz", AF_INET), None);
+    }
+
+    #[test]
+    fn test_sock_addr_to_string() {
+        let mut v4 = [0u8; 16];
+        v4[12..].copy_from_slice(&[192, 168, 1, 10]);
+        assert_eq!(sock_addr_to_string(&v4, AF_INET, 443), "192.168.1.10:443");
+
+        let v6 = "2001:db8::1".parse::<Ipv6Addr>().unwrap().octets();
+        assert_eq!(sock_addr_to_string(&v6, AF_INET6, 443), "[2001:db8::1]:443");
+        assert_eq!(
+            sock_addr_to_string(&Ipv6Addr::LOCALHOST.octets(), AF_INET6, 631),
+            "[::1]:631"
+        );
+    }
+
+    #[test]
+    fn test_parse_proc_net_content() {
+        let content = "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode\n\
+   0: 0100007F:0277 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 12345 1 0000000000000000 100 0 0 10 0\n\
+   1: 0F02000A:A2C4 22D8B85D:01BB 01 00000000:00000000 02:000A7D1E 00000000  1000        0 67890 2 0000000000000000 20 4 30 10 -1\n\
+   2: 0F02000A:A2C6 22D8B85D:01BB 06 00000000:00000000 03:00000E5A 00000000     0        0 0 3 0000000000000000\n";
+
+        let entries = parse_proc_net_content(content, "tcp", AF_INET);
+        assert_eq!(entries.len(), 2, "header and inode 0 rows are skipped");
+        assert_eq!(entries[0].local, "127.0.0.1:631");
+        assert_eq!(entries[0].remote, "0.0.0.0:0");
+        assert_eq!(entries[0].state, "LISTEN");
+        assert_eq!(entries[0].inode, 12345);
+        assert_eq!(entries[1].local, "10.0.2.15:41668");
+        assert_eq!(entries[1].remote, "93.184.216.34:443");
+        assert_eq!(entries[1].remote_port, 443);
+        assert_eq!(entries[1].state, "ESTABLISHED");
+    }
+
+    #[test]
+    fn test_next_reader_sleep() {
+        let mut sleep = READER_MIN_SLEEP;
+        for _ in 0..10 {
+            sleep = next_reader_sleep(sleep, 0, false);
+        }
+        assert_eq!(sleep, READER_MAX_SLEEP, "idle polling is capped");
+
+        assert_eq!(
+            next_reader_sleep(sleep, 0, true),
+            READER_MIN_SLEEP,
+            "lost records reset"
+        );
+        assert_eq!(
+            next_reader_sleep(sleep, 1, false),
+            READER_MIN_SLEEP,
+            "samples reset"
+        );
+        assert_eq!(
+            next_reader_sleep(READER_MIN_SLEEP, 0, false),
+            READER_MIN_SLEEP * 2
+        );
+    }
+
+    #[test]
+    fn test_prune_exited_drops_dead_pids() {
+        let connection = |pid: &str, start_time: Option<u64>| ConnectionState {
+            connection: Connection {
+                protocol: "tcp".into(),
+                state: "ESTABLISHED".into(),
+                local: "10.0.0.5:4000".into(),
+                remote: "10.0.0.1:80".into(),
+                program: "curl".into(),
+                pid: pid.into(),
+                command: "/usr/bin/curl".into(),
+                rx_rate: 0,
+                tx_rate: 0,
+            },
+            last_seen: Instant::now(),
+            start_time,
+        };
+        let mut connections = HashMap::new();
+        connections.insert(1, connection("100", Some(10)));
+        connections.insert(2, connection("100", Some(10)));
+        connections.insert(3, connection("200", Some(20)));
+        // pid 300 was reused by a process started later
+        connections.insert(4, connection("300", Some(30)));
+        connections.insert(5, connection("N/A", None));
+
+        let checked = std::cell::RefCell::new(Vec::new());
+        prune_exited(&mut connections, |pid| {
+            checked.borrow_mut().push(pid.to_string());
+            match pid {
+                "100" => Some(10),
+                "300" => Some(31),
+                _ => None,
+            }
+        });
+
+        let mut remaining: Vec<u64> = connections.keys().copied().collect();
+        remaining.sort_unstable();
+        assert_eq!(remaining, [1, 2, 5]);
+        let mut checked = checked.into_inner();
+        checked.sort();
+        assert_eq!(
+            checked,
+            ["100", "200", "300"],
+            "each process is checked once"
+        );
+    }
+
+    #[test]
+    fn test_prune_exited_keeps_unobservable_pids() {
+        // hidepid hid the process, so its stat and start time were never read
+        let mut connections = HashMap::new();
+        connections.insert(
+            1,
+            ConnectionState {
+                connection: Connection {
+                    protocol: "tcp".into(),
+                    state: "ESTABLISHED".into(),
+                    local: "10.0.0.5:4000".into(),
+                    remote: "10.0.0.1:80".into(),
+                    program: "N/A".into(),
+                    pid: "300".into(),
+                    command: String::new(),
+                    rx_rate: 0,
+                    tx_rate: 0,
+                },
+                last_seen: Instant::now(),
+                start_time: None,
+            },
+        );
+
+        prune_exited(&mut connections, |_| panic!("hidden pid was checked"));
+
+        assert!(connections.contains_key(&1));
+    }
+
+    #[test]
+    fn test_samples_io_skips_listeners_and_unknown_pids() {
+        let mut conn = Connection {
+            protocol: "tcp".into(),
+            state: "ESTABLISHED".into(),
+            local: "10.0.0.5:4000".into(),
+            remote: "10.0.0.1:80".into(),
+            program: "curl".into(),
+            pid: "1234".into(),
+            command: "/usr/bin/curl".into(),
+            rx_rate: 0,
+            tx_rate: 0,
+        };
+        assert!(samples_io(&conn));
+        conn.state = "LISTEN".into();
+        assert!(!samples_io(&conn));
+        conn.state = "ESTABLISHED".into();
+        conn.pid = "N/A".into();
+        assert!(!samples_io(&conn));
+    }
+
+    #[test]
+    fn test_tcp_state_string() {
+        assert_eq!(tcp_state_string(1), "ESTABLISHED");
+        assert_eq!(tcp_state_string(0x0A), "LISTEN");
+        assert_eq!(tcp_state_string(11), "CLOSING");
+        assert_eq!(tcp_state_string(0), "UNKNOWN");
+        assert_eq!(tcp_state_string(12), "UNKNOWN");
+    }
+
+    #[test]
+    fn test_read_io_batch_reads_each_pid_once() {
+        let own_pid = std::process::id().to_string();
+        let mut reader = ProcessIoReader::default();
+        let batch = reader.read_batch([own_pid.as_str(), own_pid.as_str(), "0"]);
+        assert_eq!(batch.len(), 2, "duplicate pids share a single sample");
+        assert_eq!(batch["0"].rx, 0, "unreadable pids fall back to zero");
+    }
+
+    #[test]
+    fn test_parse_process_io() {
+        let io = parse_process_io(
+            b"rchar: 323934931\nwchar: 323929600\nsyscr: 632687\nsyscw: 632675\n\
+              read_bytes: 0\nwrite_bytes: 0\ncancelled_write_bytes: 0\n",
+        );
+        assert_eq!((io.rx, io.tx), (323934931, 323929600));
+
+        let io = parse_process_io(b"rchar: 12ab\nwchar: 7");
+        assert_eq!((io.rx, io.tx), (0, 7));
+
+        assert_eq!(parse_io_counter(b" 18446744073709551615"), Some(u64::MAX));
+        assert_eq!(parse_io_counter(b" 18446744073709551616"), None);
+        assert_eq!(parse_io_counter(b" "), None);
+    }
+
+    #[test]
+    fn test_io_reader_keeps_handles_for_requested_pids() {
+        let own_pid = std::process::id().to_string();
+        let mut reader = ProcessIoReader::default();
+
+        let first = reader.read_batch([own_pid.as_str()]);
+        assert!(reader.files.contains_key(&own_pid));
+        std::fs::read_to_string("/proc/self/io").unwrap();
+        let second = reader.read_batch([own_pid.as_str()]);
+        assert!(
+            second[&own_pid].rx > first[&own_pid].rx,
+            "reused handle must return fresh counters"
+        );
+
+        reader.read_batch(std::iter::empty());
+        assert!(reader.files.is_empty(), "unrequested pids are closed");
+    }
+
+    #[test]
+    fn test_parse_socket_inode() {
+        assert_eq!(parse_socket_inode(Path::new("socket:[12345]")), Some(12345));
+        assert_eq!(parse_socket_inode(Path::new("pipe:[12345]")), None);
+        assert_eq!(parse_socket_inode(Path::new("/dev/null")), None);
+        assert_eq!(parse_socket_inode(Path::new("socket:[]")), None);
+        assert_eq!(parse_socket_inode(Path::new("socket:[12a]")), None);
+    }
+
+    #[test]
+    fn test_parse_stat() {
+        let stat = "4242 (tmux: (server)) S 1 4242 4242 0 -1 4194624 2830 0 0 0 \
+                    120 37 0 0 20 0 1 0 987654 24735744 1157 18446744073709551615";
+        assert_eq!(parse_stat(stat), Some((987654, "tmux: (server)")));
+        assert_eq!(parse_stat("4242 (truncated) S 1"), None);
+    }
+
+    #[test]
+    fn test_process_cache_reuses_entry_for_same_process() {
+        let own_pid = std::process::id().to_string();
+        let mut cache = ProcessCache::default();
+        let first = cache.get(&own_pid);
+        let comm = std::fs::read_to_string(format!("/proc/{own_pid}/comm")).unwrap();
+        assert_eq!(first.name, comm.trim_end_matches('\n'));
+        assert!(!first.cmdline.is_empty());
+
+        let second = cache.get(&own_pid);
+        assert_eq!(second.name, first.name);
+        assert_eq!(second.cmdline, first.cmdline);
+        assert_eq!(cache.entries.len(), 1);
+    }
+
+    #[test]
+    fn test_process_cache_sweeps_exited_processes() {
+        let mut cache = ProcessCache::default();
+        // Beyond any pid_max, so none of these exist
+        for i in 0..ProcessCache::PRUNE_THRESHOLD {
+            let pid = (1u64 << 32) + i as u64;
+            cache
+                .entries
+                .insert(pid.to_string(), (0, ProcessInfo::unknown()));
+        }
+
+        cache.get(&std::process::id().to_string());
+        assert_eq!(cache.entries.len(), 1, "only the live process is kept");
+        assert_eq!(
+            cache.prune_at, 0,
+            "no survivors, so the base threshold applies"
+        );
+    }
 }
@@ -1,141 +1,247 @@
-use std::collections::{HashMap, HashSet};
+use std::collections::{HashMap, HashSet, VecDeque};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::mpsc::{self, Receiver, Sender};
 use std::sync::{Arc, Mutex};
 use std::thread;
+use std::time::{Duration, Instant};
+
+/// How long a successful reverse lookup is reused
+const POSITIVE_TTL: Duration = Duration::from_secs(3600);
+/// How long a failed lookup is remembered before it is retried
+const NEGATIVE_TTL: Duration = Duration::from_secs(300);
+/// Upper bound on cached addresses
+const MAX_CACHE_ENTRIES: usize = 4096;
+/// Number of threads running reverse lookups
+const LOOKUP_WORKERS: usize = 5;
+
+/// Hostnames keyed by IP with an expiry time, bounded to `MAX_CACHE_ENTRIES`.
+///
+/// A `None` hostname records a failed lookup. When full, expired entries are
+/// dropped first and then the oldest insertions.
+#[derive(Default)]
+struct DnsCache {
+    entries: HashMap<String, (Instant, Option<String>)>,
+    order: VecDeque<String>,
+}
+
+impl DnsCache {
+    /// `None` on a miss or expired entry, `Some(None)` for a cached failure
+    fn get(&self, ip: &str, now: Instant) -> Option<Option<&str>> {
+        match self.entries.get(ip) {
+            Some((expires, hostname)) if *expires > now => Some(hostname.as_deref()),
+            _ => None,
+        }
+    }
+
+    fn insert(&mut self, ip: String, hostname: Option<String>, ttl: Duration, now: Instant) {
+        if !self.entries.contains_key(&ip) {
+            if self.entries.len() >= MAX_CACHE_ENTRIES {
+                self.entries.retain(|_, (expires, _)| *expires > now);
+                let entries = &self.entries;
+                self.order.retain(|key| entries.contains_key(key));
+            }
+            while self.entries.len() >= MAX_CACHE_ENTRIES {
+                match self.order.pop_front() {
+                    Some(oldest) => {
+                        self.entries.remove(&oldest);
+                    }
+                    None => break,
+                }
+            }
+            self.order.push_back(ip.clone());
+        }
+        self.entries.insert(ip, (now + ttl, hostname));
+    }
+
+    fn clear(&mut self) {
+        self.entries.clear();
+        self.order.clear();
+    }
+}
 
 #[derive(Clone)]
 pub struct AddressResolver {
-    cache: Arc<Mutex<HashMap<String, String>>>,
+    cache: Arc<Mutex<DnsCache>>,
     pending: Arc<Mutex<HashSet<String>>>,
-    resolve_hosts: Arc<Mutex<bool>>,
+    resolve_hosts: Arc<AtomicBool>,
+    lookups: Sender<String>,
+    generation: Arc<AtomicU64>,
 }
 
 impl AddressResolver {
     pub fn new(resolve_hosts: bool) -> Self {
+        let cache = Arc::new(Mutex::new(DnsCache::default()));
+        let pending = Arc::new(Mutex::new(HashSet::new()));
+        let generation = Arc::new(AtomicU64::new(0));
+
+        // A fixed pool drains the lookup queue; the workers exit once the
+        // last resolver clone (and with it the sender) is dropped
+        let (lookups, queue) = mpsc::channel();
+        let queue = Arc::new(Mutex::new(queue));
+        for _ in 0..LOOKUP_WORKERS {
+            let queue = queue.clone();
+            let cache = cache.clone();
+            let pending = pending.clone();
+            let generation = generation.clone();
+            thread::spawn(move || Self::lookup_worker(&queue, &cache, &pending, &generation));
+        }
+
         Self {
-            cache: Arc::new(Mutex::new(HashMap::new())),
-            pending: Arc::new(Mutex::new(HashSet::new())),
-            resolve_hosts: Arc::new(Mutex::new(resolve_hosts)),
+            cache,
+            pending,
+            resolve_hosts: Arc::new(AtomicBool::new(resolve_hosts)),
+            lookups,
+            generation,
         }
     }
 
+    fn lookup_worker(
+        queue: &Mutex<Receiver<String>>,
+        cache: &Mutex<DnsCache>,
+        pending: &Mutex<HashSet<String>>,
+        generation: &AtomicU64,
+    ) {
+        loop {
+            let ip = match queue.lock() {
+                Ok(queue) => queue.recv(),
+                Err(_) => return,
+            };
+            let Ok(ip) = ip else {
+                return;
+            };
+
+            // Failed lookups are cached too, but retried much sooner
+            let hostname = Self::lookup_hostname(&ip);
+            let resolved = hostname.is_some();
+            let ttl = if resolved { POSITIVE_TTL } else { NEGATIVE_TTL };
+            if let Ok(mut cache) = cache.lock() {
+                cache.insert(ip.clone(), hostname, ttl, Instant::now());
+            }
+            if resolved {
+                generation.fetch_add(1, Ordering::Relaxed);
+            }
+
+            if let Ok(mut pending) = pending.lock() {
+                pending.remove(&ip);
+            }
+        }
+    }
+
+    /// Reverse lookup of `ip` through `host`, bounded to five seconds
+    fn lookup_hostname(ip: &str) -> Option<String> {
+        let output = std::process::Command::new("timeout")
+            .args(["5s", "host", ip])
+            .output()
+            .ok()?;
+
+        Self::parse_host_output(&String::from_utf8_lossy(&output.stdout)).map(str::to_string)
+    }
+
+    /// Hostname from `host` output, borrowed from the output itself.
+    ///
+    /// Each line is split once on its marker phrase instead of being
+    /// tokenized. Only PTR answers count: an alias target is another
+    /// `in-addr.arpa` name, not a hostname. The last answer wins.
+    fn parse_host_output(output: &str) -> Option<&str> {
+        output
+            .lines()
+            .filter_map(|line| line.split_once(" domain name pointer "))
+            .filter_map(|(_, name)| name.split_whitespace().next())
+            .next_back()
+            .map(|name| name.trim_end_matches('.'))
+    }
+
+    /// Split `ip:port` or `[ipv6]:port` into the bare IP and the port
+    fn split_host_port(addr: &str) -> (&str, &str) {
+        match addr.rsplit_once(':') {
+            Some((ip, port)) => {
+                let ip = ip
+                    .strip_prefix('[')
+                    .and_then(|ip| ip.strip_suffix(']'))
+                    .unwrap_or(ip);
+                (ip, port)
+            }
+            None => (addr, ""),
+        }
+    }
+
+    /// Label for well-known addresses that never need a DNS lookup.
+    ///
+    /// Unconnected peers appear as `*` in `ss`-style output and as port 0 in
+    /// `/proc/net`, so both spellings map to `ANY`.
+    fn special_label(addr: &str) -> Option<&'static str> {
+        match addr {
+            "0.0.0.0:*" | "*:*" | "[::]:*" | "0.0.0.0:0" | "[::]:0" => Some("ANY"),
+            _ if Self::is_localhost(addr) => Some("LOCALHOST"),
+            _ if addr.starts_with("224.0.0.251:") => Some("MDNS"),
+            _ => None,
+        }
+    }
+
+    /// Whether `addr` is a loopback peer, i.e. resolves to `LOCALHOST`.
+    ///
+    /// A plain prefix test, cheap enough for filtering every connection.
+    pub fn is_localhost(addr: &str) -> bool {
+        addr.starts_with("127.0.0.1:") || addr.starts_with("[::1]:")
+    }
+
     pub fn resolve_address(&self, addr: &str) -> String {
-        if addr == "0.0.0.0:*" || addr == "*:*" || addr == "[::]:*" {
-            return "ANY".to_string();
-        } else if addr.starts_with("127.0.0.1:") || addr.starts_with("[::1]:") {
-            return "LOCALHOST".to_string();
-        } else if addr.starts_with("224.0.0.251:") {
-            return "MDNS".to_string();
+        if let Some(label) = Self::special_label(addr) {
+            return label.to_string();
         }
 
-        let resolve_hosts = match self.resolve_hosts.lock() {
-            Ok(guard) => *guard,
-            Err(_) => return addr.to_string(),
-        };
-        if !resolve_hosts {
+        // Checked on every address, so a plain atomic load rather than a lock
+        if !self.resolve_hosts.load(Ordering::Relaxed) {
             return addr.to_string();
         }
 
+        // Hostnames are cached per IP, so every port of a peer shares one lookup
+        let (ip_part, port) = Self::split_host_port(addr);
         {
             let cache = match self.cache.lock() {
                 Ok(guard) => guard,
                 Err(_) => return addr.to_string(),
             };
-            if let Some(resolved) = cache.get(addr) {
-                return resolved.clone();
+            match cache.get(ip_part, Instant::now()) {
+                Some(Some(hostname)) if port.is_empty() => return hostname.to_string(),
+                Some(Some(hostname)) => return format!("{hostname}:{port}"),
+                Some(None) => return addr.to_string(),
+                None => {}
             }
         }
 
-        let (ip_part, port) = if let Some(last_colon) = addr.rfind(':') {
-            let ip_with_brackets = &addr[..last_colon];
-            let port = &addr[last_colon + 1..];
-
-            let ip_part = if ip_with_brackets.starts_with('[') && ip_with_brackets.ends_with(']') {
-                &ip_with_brackets[1..ip_with_brackets.len() - 1]
-            } else {
-                ip_with_brackets
-            };
-
-            (ip_part.to_string(), port.to_string())
-        } else {
-            (addr.to_string(), String::new())
-        };
-
         {
             let mut pending = match self.pending.lock() {
                 Ok(guard) => guard,
                 Err(_) => return addr.to_string(),
             };
-            if !pending.contains(&ip_part) {
-                pending.insert(ip_part.clone());
-
-                let addr = addr.to_string();
-                let cache = self.cache.clone();
-                let pending = self.pending.clone();
-
-                thread::spawn(move || {
-                    let resolved = match std::process::Command::new("timeout")
-                        .args(["5s", "host", &ip_part])
-                        .output()
-                    {
-                        Ok(output) => {
-                            let output_str = String::from_utf8_lossy(&output.stdout);
-                            let mut result = addr.clone();
-                            for line in output_str.lines() {
-                                if line.contains("domain name pointer")
-                                    || line.contains("is an alias for")
-                                {
-                                    let parts: Vec<&str> = line.split_whitespace().collect();
-                                    for (i, part) in parts.iter().enumerate() {
-                                        if (*part == "pointer" || *part == "alias")
-                                            && i + 1 < parts.len()
-                                        {
-                                            let hostname = parts[i + 1].trim_end_matches('.');
-                                            if port.is_empty() {
-                                                result = hostname.to_string();
-                                            } else {
-                                                result = format!("{hostname}:{port}");
-                                            }
-                                            break;
-                                        }
-                                    }
-                                }
-                            }
-                            result
-                        }
-                        Err(_) => addr.clone(),
-                    };
-
-                    if let Ok(mut cache) = cache.lock() {
-                        cache.insert(addr.clone(), resolved);
-                    }
-
-                    if let Ok(mut pending) = pending.lock() {
-                        pending.remove(&ip_part);
-                    }
-                });
+            if !pending.contains(ip_part) {
+                pending.insert(ip_part.to_string());
+                let _ = self.lookups.send(ip_part.to_string());
             }
         }
 
         addr.to_string()
     }
 
+    /// Counter bumped whenever a lookup produces a new hostname, so views can
+    /// tell when cached text is stale without polling each address.
+    pub fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Relaxed)
+    }
+
     pub fn set_resolve_hosts(&self, resolve: bool) {
-        if let Ok(mut resolve_hosts) = self.resolve_hosts.lock() {
-            *resolve_hosts = resolve;
-            if !resolve {
-                if let Ok(mut cache) = self.cache.lock() {
-                    cache.clear();
-                }
+        self.resolve_hosts.store(resolve, Ordering::Relaxed);
+        if !resolve {
+            if let Ok(mut cache) = self.cache.lock() {
+                cache.clear();
             }
         }
     }
 
     #[allow(dead_code)]
     pub fn get_resolve_hosts(&self) -> bool {
-        self.resolve_hosts
-            .lock()
-            .map(|guard| *guard)
-            .unwrap_or(false)
+        self.resolve_hosts.load(Ordering::Relaxed)
     }
 
     #[allow(dead_code)]
@@ -145,3 +251,122 @@ impl AddressResolver {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_special_addresses() {
+        let resolver = AddressResolver::new(false);
+        assert_eq!(resolver.resolve_address("0.0.0.0:*"), "ANY");
+        assert_eq!(resolver.resolve_address("0.0.0.0:0"), "ANY");
+        assert_eq!(resolver.resolve_address("[::]:0"), "ANY");
+        assert_eq!(resolver.resolve_address("127.0.0.1:631"), "LOCALHOST");
+        assert_eq!(resolver.resolve_address("[::1]:631"), "LOCALHOST");
+        assert_eq!(resolver.resolve_address("224.0.0.251:5353"), "MDNS");
+        assert_eq!(resolver.resolve_address("10.0.0.1:443"), "10.0.0.1:443");
+    }
+
+    #[test]
+    fn test_is_localhost() {
+        assert!(AddressResolver::is_localhost("127.0.0.1:631"));
+        assert!(AddressResolver::is_localhost("[::1]:631"));
+        assert!(!AddressResolver::is_localhost("10.0.0.1:443"));
+        assert!(!AddressResolver::is_localhost("[::]:0"));
+    }
+
+    #[test]
+    fn test_dns_cache_expires_entries() {
+        let mut cache = DnsCache::default();
+        let now = Instant::now();
+        cache.insert(
+            "10.0.0.1".to_string(),
+            Some("example.com".to_string()),
+            POSITIVE_TTL,
+            now,
+        );
+        cache.insert("10.0.0.2".to_string(), None, NEGATIVE_TTL, now);
+
+        assert_eq!(cache.get("10.0.0.2", now), Some(None));
+        let later = now + NEGATIVE_TTL + Duration::from_secs(1);
+        assert_eq!(cache.get("10.0.0.1", later), Some(Some("example.com")));
+        assert_eq!(cache.get("10.0.0.2", later), None);
+        assert_eq!(cache.get("10.0.0.1", now + POSITIVE_TTL), None);
+    }
+
+    #[test]
+    fn test_dns_cache_is_bounded() {
+        let mut cache = DnsCache::default();
+        let now = Instant::now();
+        for i in 0..=MAX_CACHE_ENTRIES {
+            cache.insert(format!("addr{i}"), None, POSITIVE_TTL, now);
+        }
+
+        assert_eq!(cache.entries.len(), MAX_CACHE_ENTRIES);
+        assert_eq!(cache.get("addr0", now), None);
+        assert_eq!(
+            cache.get(&format!("addr{MAX_CACHE_ENTRIES}"), now),
+            Some(None)
+        );
+    }
+
+    #[test]
+    fn test_split_host_port() {
+        assert_eq!(
+            AddressResolver::split_host_port("10.0.0.1:443"),
+            ("10.0.0.1", "443")
+        );
+        assert_eq!(
+            AddressResolver::split_host_port("[2001:db8::1]:443"),
+            ("2001:db8::1", "443")
+        );
+        assert_eq!(
+            AddressResolver::split_host_port("10.0.0.1"),
+            ("10.0.0.1", "")
+        );
+    }
+
+    #[test]
+    fn test_parse_host_output() {
+        assert_eq!(
+            AddressResolver::parse_host_output(
+                "34.216.184.93.in-addr.arpa domain name pointer example.com.\n"
+            ),
+            Some("example.com")
+        );
+        assert_eq!(
+            AddressResolver::parse_host_output(
+                "1.0.0.10.in-addr.arpa is an alias for 1.0/24.0.0.10.in-addr.arpa.\n\
+                 1.0/24.0.0.10.in-addr.arpa domain name pointer gw.example.net.\n"
+            ),
+            Some("gw.example.net")
+        );
+        assert_eq!(
+            AddressResolver::parse_host_output(
+                "1.0.0.10.in-addr.arpa is an alias for 1.0/24.0.0.10.in-addr.arpa.\n"
+            ),
+            None
+        );
+        assert_eq!(
+            AddressResolver::parse_host_output(
+                "Host 1.0.0.10.in-addr.arpa. not found: 3(NXDOMAIN)\n"
+            ),
+            None
+        );
+    }
+
+    #[test]
+    fn test_cached_hostname_is_shared_across_ports() {
+        let resolver = AddressResolver::new(true);
+        resolver.cache.lock().unwrap().insert(
+            "10.0.0.1".to_string(),
+            Some("example.com".to_string()),
+            POSITIVE_TTL,
+            Instant::now(),
+        );
+
+        assert_eq!(resolver.resolve_address("10.0.0.1:443"), "example.com:443");
+        assert_eq!(resolver.resolve_address("10.0.0.1:80"), "example.com:80");
+    }
+}
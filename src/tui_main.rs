@@ -2,16 +2,20 @@ use crossterm::{
     event::{
         self, DisableMouseCapture, EnableMouseCapture, Event, KeyCode, KeyEventKind, KeyModifiers,
     },
-    execute,
-    terminal::{disable_raw_mode, enable_raw_mode, EnterAlternateScreen, LeaveAlternateScreen},
+    execute, queue,
+    terminal::{
+        disable_raw_mode, enable_raw_mode, BeginSynchronizedUpdate, EndSynchronizedUpdate,
+        EnterAlternateScreen, LeaveAlternateScreen,
+    },
 };
 use error::Result;
 use models::Connection;
 use services::connection_monitor::ConnectionMonitor;
 use services::{detect_best_monitor, AddressResolver};
-use std::collections::HashMap;
+use std::borrow::Cow;
+use std::collections::{HashMap, HashSet};
 use std::env;
-use std::io;
+use std::io::{self, BufWriter};
 use std::time::{Duration, Instant};
 use tui::{
     backend::CrosstermBackend,
@@ -72,9 +76,8 @@ struct App {
     sort_ascending: bool,
     horizontal_scroll: usize,
     layout_cache: LayoutCache,
-    last_render_time: Instant,
-    render_count: usize,
-    skip_next_render: bool,
+    /// `program(pid)` labels keyed by pid, with the program they were built for
+    process_labels: HashMap<String, (String, String)>,
 }
 
 impl App {
@@ -91,9 +94,7 @@ impl App {
             sort_ascending: false, // Descending order
             horizontal_scroll: 0,
             layout_cache: LayoutCache::new(),
-            last_render_time: Instant::now(),
-            render_count: 0,
-            skip_next_render: false,
+            process_labels: HashMap::new(),
         };
         app.update_connections();
         app
@@ -107,19 +108,11 @@ impl App {
                     .update_connection_rates(connections, &self.previous_io)
                 {
                     Ok((updated_connections, current_io)) => {
-                        // Skip render if connection count hasn't changed significantly
-                        let significant_change = (updated_connections.len() as isize
-                            - self.connections.len() as isize)
-                            .abs()
-                            > 5;
-
                         self.connections = updated_connections;
                         self.previous_io = current_io;
                         self.last_update = Instant::now();
+                        self.refresh_process_labels();
                         self.sort_connections();
-
-                        // Skip next render if no significant changes to improve performance
-                        self.skip_next_render = !significant_change && self.connections.len() > 50;
                     }
                     Err(e) => {
                         // Log error but continue with existing data
@@ -136,26 +129,45 @@ impl App {
         }
     }
 
+    /// Build `program(pid)` labels once per process instead of once per row
+    /// on every redraw, and forget pids that no longer own a connection.
+    fn refresh_process_labels(&mut self) {
+        let labels = &mut self.process_labels;
+        for conn in self.connections.iter().filter(|conn| conn.pid != "N/A") {
+            match labels.get(&conn.pid) {
+                Some((program, _)) if *program == conn.program => {}
+                _ => {
+                    labels.insert(
+                        conn.pid.clone(),
+                        (conn.program.clone(), conn.get_process_display()),
+                    );
+                }
+            }
+        }
+
+        let live: HashSet<&str> = self.connections.iter().map(|c| c.pid.as_str()).collect();
+        labels.retain(|pid, _| live.contains(pid.as_str()));
+    }
+
     fn sort_connections(&mut self) {
-        self.connections.sort_by(|a, b| {
-            let ordering = match self.sort_column {
-                0 => a.program.cmp(&b.program),
-                1 => a.protocol.cmp(&b.protocol),
-                2 => a.local.cmp(&b.local),
-                3 => a.remote.cmp(&b.remote),
-                4 => a.state.cmp(&b.state),
-                5 => a.tx_rate.cmp(&b.tx_rate),
-                6 => a.rx_rate.cmp(&b.rx_rate),
-                7 => a.command.cmp(&b.command),
-                _ => std::cmp::Ordering::Equal,
-            };
+        // Pick the comparison once instead of matching the column per pair
+        let compare: fn(&Connection, &Connection) -> std::cmp::Ordering = match self.sort_column {
+            0 => |a, b| a.program.cmp(&b.program),
+            1 => |a, b| a.protocol.cmp(&b.protocol),
+            2 => |a, b| a.local.cmp(&b.local),
+            3 => |a, b| a.remote.cmp(&b.remote),
+            4 => |a, b| a.state.cmp(&b.state),
+            5 => |a, b| a.tx_rate.cmp(&b.tx_rate),
+            6 => |a, b| a.rx_rate.cmp(&b.rx_rate),
+            7 => |a, b| a.command.cmp(&b.command),
+            _ => return,
+        };
 
-            if self.sort_ascending {
-                ordering
-            } else {
-                ordering.reverse()
-            }
-        });
+        if self.sort_ascending {
+            self.connections.sort_by(compare);
+        } else {
+            self.connections.sort_by(|a, b| compare(b, a));
+        }
     }
 
     fn next_row(&mut self) {
@@ -221,6 +233,35 @@ fn format_bytes(bytes: u64) -> String {
     Formatter::format_bytes(bytes)
 }
 
+/// Connection table column titles in display order
+const COLUMN_TITLES: [&str; 8] = [
+    "Process(ID)",
+    "Protocol",
+    "Source",
+    "Destination",
+    "Status",
+    "TX",
+    "RX",
+    "Path",
+];
+
+/// Stable minimum column widths; the Path column is widest
+const COLUMN_WIDTHS: [usize; COLUMN_TITLES.len()] = [15, 10, 18, 22, 12, 10, 12, 40];
+
+/// Row styles by protocol (TCP, UDP, other) and then by emphasis (idle,
+/// active, selected), so rows pick a prebuilt style instead of composing one
+const ROW_STYLES: [[Style; 3]; 3] = [
+    row_styles(Color::Green),
+    row_styles(Color::Yellow),
+    row_styles(Color::White),
+];
+
+const fn row_styles(color: Color) -> [Style; 3] {
+    let idle = Style::new().fg(color);
+    let active = idle.add_modifier(Modifier::BOLD);
+    [idle, active, active.bg(Color::DarkGray)]
+}
+
 fn ui(f: &mut Frame, app: &mut App) {
     let chunks = Layout::default()
         .direction(Direction::Vertical)
@@ -280,86 +321,9 @@ fn ui(f: &mut Frame, app: &mut App) {
     f.render_widget(header, chunks[0]);
 
     // Connections table
-    let header_cells = [
-        "Process(ID)",
-        "Protocol",
-        "Source",
-        "Destination",
-        "Status",
-        "TX",
-        "RX",
-        "Path",
-    ]
-    .iter()
-    .enumerate()
-    .map(|(i, &title)| {
-        let style = if i == app.sort_column {
-            Style::default()
-                .fg(Color::Cyan)
-                .add_modifier(Modifier::BOLD)
-        } else {
-            Style::default().fg(Color::Gray)
-        };
-
-        let arrow = if i == app.sort_column {
-            if app.sort_ascending {
-                " ↑"
-            } else {
-                " ↓"
-            }
-        } else {
-            ""
-        };
-
-        Span::styled(format!("{}{}", title, arrow), style)
-    });
-
-    let _header = Row::new(header_cells)
-        .style(Style::default().add_modifier(Modifier::REVERSED))
-        .height(1);
-
-    let _rows = app.connections.iter().enumerate().map(|(i, conn)| {
-        let color = match conn.protocol.as_str() {
-            "tcp" | "tcp6" => Color::Green,
-            "udp" | "udp6" => Color::Yellow,
-            _ => Color::White,
-        };
-
-        let is_selected = app
-            .table_state
-            .selected()
-            .map(|sel| sel == i)
-            .unwrap_or(false);
-
-        let style = if is_selected {
-            Style::default()
-                .fg(color)
-                .add_modifier(Modifier::BOLD)
-                .bg(Color::DarkGray)
-        } else if conn.is_active() {
-            Style::default().fg(color).add_modifier(Modifier::BOLD)
-        } else {
-            Style::default().fg(color)
-        };
-
-        let cells = vec![
-            Span::raw(conn.get_process_display()),
-            Span::raw(&conn.protocol),
-            Span::raw(&conn.local),
-            Span::raw(&conn.remote),
-            Span::raw(&conn.state),
-            Span::raw(format_bytes(conn.tx_rate)),
-            Span::raw(format_bytes(conn.rx_rate)),
-            Span::raw(&conn.command),
-        ];
-
-        Row::new(cells).style(style)
-    });
-
     // Calculate visible columns based on horizontal scroll with caching
-    let total_columns: usize = 8;
+    let total_columns = COLUMN_TITLES.len();
     let available_width = chunks[1].width.saturating_sub(2) as usize; // Subtract borders
-    let column_widths = [15, 10, 18, 22, 12, 10, 12, 40]; // Stable minimum widths - increased Path column width
     let start_col = app.horizontal_scroll.min(total_columns.saturating_sub(1));
 
     // Check if we can use cached layout
@@ -375,8 +339,8 @@ fn ui(f: &mut Frame, app: &mut App) {
                     .iter()
                     .enumerate()
                     .map(|(i, &col_idx)| {
-                        if i < column_widths.len() {
-                            column_widths[col_idx]
+                        if i < COLUMN_WIDTHS.len() {
+                            COLUMN_WIDTHS[col_idx]
                         } else {
                             10
                         }
@@ -391,7 +355,7 @@ fn ui(f: &mut Frame, app: &mut App) {
         let mut current_width = 0;
 
         // Determine which columns to show - be more conservative to avoid frequent changes
-        for (i, &width) in column_widths
+        for (i, &width) in COLUMN_WIDTHS
             .iter()
             .enumerate()
             .skip(start_col)
@@ -424,16 +388,6 @@ fn ui(f: &mut Frame, app: &mut App) {
     };
 
     // Create header with visible columns only
-    let header_titles = [
-        "Process(ID)",
-        "Protocol",
-        "Source",
-        "Destination",
-        "Status",
-        "TX",
-        "RX",
-        "Path",
-    ];
     let visible_header_cells: Vec<_> = visible_columns
         .iter()
         .map(|&col_idx| {
@@ -455,8 +409,8 @@ fn ui(f: &mut Frame, app: &mut App) {
                 ""
             };
 
-            let title = if col_idx < header_titles.len() {
-                header_titles[col_idx]
+            let title = if col_idx < COLUMN_TITLES.len() {
+                COLUMN_TITLES[col_idx]
             } else {
                 ""
             };
@@ -470,49 +424,39 @@ fn ui(f: &mut Frame, app: &mut App) {
         .height(1);
 
     // Create rows with visible columns only
+    let selected = app.table_state.selected();
     let visible_rows = app.connections.iter().enumerate().map(|(i, conn)| {
-        let color = match conn.protocol.as_str() {
-            "tcp" | "tcp6" => Color::Green,
-            "udp" | "udp6" => Color::Yellow,
-            _ => Color::White,
+        let protocol = match conn.protocol.as_str() {
+            "tcp" | "tcp6" => 0,
+            "udp" | "udp6" => 1,
+            _ => 2,
         };
-
-        let is_selected = app
-            .table_state
-            .selected()
-            .map(|sel| sel == i)
-            .unwrap_or(false);
-
-        let style = if is_selected {
-            Style::default()
-                .fg(color)
-                .add_modifier(Modifier::BOLD)
-                .bg(Color::DarkGray)
-        } else if conn.is_active() {
-            Style::default().fg(color).add_modifier(Modifier::BOLD)
+        let emphasis = if selected == Some(i) {
+            2
         } else {
-            Style::default().fg(color)
+            usize::from(conn.is_active())
         };
-
-        let all_cells = [
-            conn.get_process_display(),
-            conn.protocol.clone(),
-            conn.local.clone(),
-            app.resolver.resolve_address(&conn.remote),
-            conn.state.clone(),
-            format_bytes(conn.tx_rate),
-            format_bytes(conn.rx_rate),
-            conn.command.clone(),
-        ];
+        let style = ROW_STYLES[protocol][emphasis];
 
         let visible_cells: Vec<_> = visible_columns
             .iter()
             .enumerate()
             .map(|(i, &col_idx)| {
-                let cell_content = if col_idx < all_cells.len() {
-                    all_cells[col_idx].clone()
-                } else {
-                    "".to_string()
+                // Only the visible columns are formatted, and text the
+                // connection or the label cache already holds is borrowed
+                let cell_content: Cow<str> = match col_idx {
+                    0 => match app.process_labels.get(&conn.pid) {
+                        Some((program, label)) if *program == conn.program => label.into(),
+                        _ => conn.get_process_display().into(),
+                    },
+                    1 => conn.protocol.as_str().into(),
+                    2 => conn.local.as_str().into(),
+                    3 => app.resolver.resolve_address(&conn.remote).into(),
+                    4 => conn.state.as_str().into(),
+                    5 => format_bytes(conn.tx_rate).into(),
+                    6 => format_bytes(conn.rx_rate).into(),
+                    7 => conn.command.as_str().into(),
+                    _ => "".into(),
                 };
 
                 // Don't truncate last column - give it full remaining space
@@ -520,14 +464,14 @@ fn ui(f: &mut Frame, app: &mut App) {
                 let max_width = if is_last_column {
                     // For last column, use remaining width or a large number
                     remaining_width.max(100)
-                } else if col_idx < column_widths.len() {
-                    column_widths[col_idx]
+                } else if col_idx < COLUMN_WIDTHS.len() {
+                    COLUMN_WIDTHS[col_idx]
                 } else {
                     10
                 };
 
                 let truncated = if !is_last_column && cell_content.len() > max_width {
-                    format!("{}...", &cell_content[..max_width.saturating_sub(3)])
+                    format!("{}...", &cell_content[..max_width.saturating_sub(3)]).into()
                 } else {
                     cell_content
                 };
@@ -546,9 +490,9 @@ fn ui(f: &mut Frame, app: &mut App) {
             // Give the last column the remaining width
             if i == visible_columns.len().saturating_sub(1) && remaining_width > 0 {
                 Constraint::Min(remaining_width as u16)
-            } else if col_idx < column_widths.len() {
+            } else if col_idx < COLUMN_WIDTHS.len() {
                 // Use fixed widths for better stability
-                Constraint::Length(column_widths[col_idx] as u16)
+                Constraint::Length(COLUMN_WIDTHS[col_idx] as u16)
             } else {
                 Constraint::Length(10)
             }
@@ -609,6 +553,15 @@ fn ui(f: &mut Frame, app: &mut App) {
 
 const VERSION: &str = env!("CARGO_PKG_VERSION");
 
+/// Period of automatic data refreshes
+const DATA_REFRESH_INTERVAL: Duration = Duration::from_secs(2);
+/// Minimum spacing between redraws triggered only by hostname resolution
+const RESOLVER_REDRAW_INTERVAL: Duration = Duration::from_millis(100);
+/// Redraw at least this often so the "Last: ...s ago" clock keeps moving
+const IDLE_REDRAW_INTERVAL: Duration = Duration::from_secs(1);
+/// Output buffer size; large enough that a full-screen frame fits in one write
+const FRAME_BUFFER_CAPACITY: usize = 64 * 1024;
+
 fn main() -> Result<()> {
     // Check for --version argument
     let args: Vec<String> = env::args().collect();
@@ -636,17 +589,25 @@ fn main() -> Result<()> {
             std::process::exit(1);
         }
     }
-    let mut stdout = io::stdout();
+    // ratatui already sends only the cells that changed; buffering stdout
+    // turns each frame's escape sequences into a single write on flush
+    let mut stdout = BufWriter::with_capacity(FRAME_BUFFER_CAPACITY, io::stdout());
     execute!(stdout, EnterAlternateScreen, EnableMouseCapture)?;
     let backend = CrosstermBackend::new(stdout);
     let mut terminal = Terminal::new(backend)?;
 
     let mut app = App::with_monitor(monitor);
-    let mut last_tick = Instant::now();
+    let mut next_tick = Instant::now() + DATA_REFRESH_INTERVAL;
 
     let mut last_input_time = Instant::now();
     let mut needs_data_update = false;
 
+    // Redraw only when something visible changed: input, resize, new data,
+    // or hostnames resolved since the last frame
+    let mut needs_redraw = true;
+    let mut last_draw = Instant::now();
+    let mut drawn_generation = app.resolver.generation();
+
     loop {
         // Check for user input first - this is the priority
         let timeout = Duration::from_millis(16); // ~60 FPS
@@ -654,8 +615,13 @@ fn main() -> Result<()> {
         if crossterm::event::poll(timeout)? {
             last_input_time = Instant::now();
 
-            if let Event::Key(key) = event::read()? {
+            let event = event::read()?;
+            if let Event::Resize(..) = event {
+                needs_redraw = true;
+            }
+            if let Event::Key(key) = event {
                 if key.kind == KeyEventKind::Press {
+                    needs_redraw = true;
                     match key.code {
                         KeyCode::Char('q') => break,
                         KeyCode::Char('r') => app.toggle_resolver(),
@@ -699,35 +665,46 @@ fn main() -> Result<()> {
         }
 
         // Only update data when user is idle AND we need to update
-        if needs_data_update
-            || (app.auto_refresh
-                && last_input_time.elapsed() >= Duration::from_millis(500)
-                && last_tick.elapsed() >= Duration::from_secs(2))
-        {
+        let tick_due = app.auto_refresh
+            && last_input_time.elapsed() >= Duration::from_millis(500)
+            && Instant::now() >= next_tick;
+        if needs_data_update || tick_due {
             app.update_connections();
-            last_tick = Instant::now();
+            // Scheduled ticks advance the deadline itself, so the time spent
+            // collecting does not stretch the period. Manual refreshes and
+            // ticks held back by input start a fresh period instead.
+            let deadline = next_tick + DATA_REFRESH_INTERVAL;
+            next_tick = if tick_due && deadline > Instant::now() {
+                deadline
+            } else {
+                Instant::now() + DATA_REFRESH_INTERVAL
+            };
             needs_data_update = false;
+            needs_redraw = true;
         }
 
-        // Skip rendering if no significant changes to improve performance
-        if app.skip_next_render && app.connections.len() > 50 {
-            app.skip_next_render = false;
-        } else {
-            // Always draw last - this ensures instant UI response
-            terminal.draw(|f| ui(f, &mut app))?;
+        // Hostnames arriving in a burst share a single redraw
+        if !needs_redraw
+            && app.resolver.generation() != drawn_generation
+            && last_draw.elapsed() >= RESOLVER_REDRAW_INTERVAL
+        {
+            needs_redraw = true;
+        }
+        if last_draw.elapsed() >= IDLE_REDRAW_INTERVAL {
+            needs_redraw = true;
+        }
 
-            // Track render performance
-            app.render_count += 1;
-            let now = Instant::now();
-            if now.duration_since(app.last_render_time).as_secs() >= 5 {
-                let fps = app.render_count as f64
-                    / now.duration_since(app.last_render_time).as_secs_f64();
-                if fps < 30.0 {
-                    eprintln!("Performance warning: Low FPS ({:.1}) detected", fps);
-                }
-                app.render_count = 0;
-                app.last_render_time = now;
-            }
+        if needs_redraw {
+            drawn_generation = app.resolver.generation();
+            // Terminals that support synchronized output show the frame only
+            // once it is complete; others ignore the sequence. draw() flushes
+            // the frame itself, so the end marker goes out as a second, tiny
+            // write.
+            queue!(terminal.backend_mut(), BeginSynchronizedUpdate)?;
+            terminal.draw(|f| ui(f, &mut app))?;
+            execute!(terminal.backend_mut(), EndSynchronizedUpdate)?;
+            last_draw = Instant::now();
+            needs_redraw = false;
         }
     }
 
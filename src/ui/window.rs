@@ -1,12 +1,17 @@
 use adw::{prelude::*, AboutWindow, Application, ApplicationWindow, HeaderBar};
 use gio::{ActionEntry, Menu};
-use glib::{timeout_add_local, timeout_add_seconds_local};
+use glib::{timeout_add_local_once, timeout_add_seconds_local_once, BoxedAnyObject};
 use gtk::{
-    Align, Box as GtkBox, Grid, Label, MenuButton, Orientation, PopoverMenu, ScrolledWindow,
+    Align, Box as GtkBox, ColumnView, ColumnViewColumn, CustomSorter, Label, ListItem, MenuButton,
+    Orientation, PopoverMenu, ScrolledWindow, SignalListItemFactory, SingleSelection,
+    SortListModel, SortType,
 };
 use gtk4 as gtk;
-use std::cell::RefCell;
+use std::cell::{Cell, Ref, RefCell};
+use std::cmp::Ordering;
+use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
 use std::rc::Rc;
 use std::sync::{Arc, Mutex};
 use std::time::{Duration, Instant};
@@ -16,30 +21,137 @@ use crate::services::connection_monitor::ConnectionMonitor;
 use crate::services::{detect_best_monitor, AddressResolver};
 use crate::utils::formatter::Formatter;
 
+/// Column titles in display order
+const COLUMN_TITLES: [&str; 8] = [
+    "Process(ID)",
+    "Protocol",
+    "Source",
+    "Destination",
+    "Status",
+    "TX",
+    "RX",
+    "Path",
+];
+
+/// Initial column widths; the Path column (last) expands to fill the rest
+const COLUMN_WIDTHS: [i32; 7] = [150, 70, 160, 200, 100, 80, 80];
+
+/// TX and RX columns, which compare rates numerically
+const TX_COLUMN: usize = 5;
+const RX_COLUMN: usize = 6;
+/// Path column, the only one that is not ellipsized
+const PATH_COLUMN: usize = 7;
+
+/// Refresh interval while connections are changing, in seconds
+const MIN_REFRESH_SECS: u32 = 3;
+/// Longest interval the refresh backs off to when nothing changes
+const MAX_REFRESH_SECS: u32 = 15;
+/// Unchanged refreshes in a row before the interval is doubled
+const IDLE_REFRESHES_BEFORE_BACKOFF: u32 = 2;
+
 /// Main application window
 pub struct NetworkMonitorWindow {
     pub window: ApplicationWindow,
-    header_grid: Grid,
-    content_grid: Grid,
+    column_view: ColumnView,
+    store: gio::ListStore,
     resolve_toggle: gtk::CheckButton,
-    header_labels: Rc<RefCell<Vec<Label>>>,
     prev_io: Arc<Mutex<HashMap<String, ProcessIO>>>,
     resolver: AddressResolver,
-    monitor: Box<dyn ConnectionMonitor>,
-    sort_column: Rc<RefCell<usize>>,
-    sort_ascending: Rc<RefCell<bool>>,
-    row_widgets: Rc<RefCell<Vec<Label>>>,
-    selected_row: Rc<RefCell<Option<usize>>>,
+    monitor: Arc<Mutex<Box<dyn ConnectionMonitor>>>,
     connection_labels: Rc<RefCell<(Label, Label, Label, Label)>>,
-    column_widths: Rc<RefCell<Vec<i32>>>,
     active_popovers: Rc<RefCell<Vec<PopoverMenu>>>,
 
     // Performance optimization fields
     last_update_time: Rc<RefCell<Instant>>,
     debounce_timeout: Rc<RefCell<Option<glib::SourceId>>>,
-    column_width_cache: Rc<RefCell<HashMap<usize, i32>>>,
-    virtualization_enabled: Rc<RefCell<bool>>,
-    max_visible_rows: Rc<RefCell<usize>>,
+    collecting: Cell<bool>,
+    /// An update was requested while a collection was running
+    refresh_pending: Cell<bool>,
+    refresh: RefCell<RefreshBackoff>,
+    refresh_timeout: RefCell<Option<glib::SourceId>>,
+}
+
+/// A connection together with the text of each of its cells.
+///
+/// The text is formatted once per refresh, so neither binding nor sorting
+/// goes back to the resolver or the formatter.
+struct ConnectionRow {
+    connection: Connection,
+    cells: [String; COLUMN_TITLES.len()],
+}
+
+impl ConnectionRow {
+    fn new(connection: Connection, resolver: &AddressResolver) -> Self {
+        let cells = [
+            connection.get_process_display(),
+            connection.protocol.clone(),
+            resolver.resolve_address(&connection.local),
+            resolver.resolve_address(&connection.remote),
+            connection.state.clone(),
+            Formatter::format_bytes(connection.tx_rate),
+            Formatter::format_bytes(connection.rx_rate),
+            connection.command.clone(),
+        ];
+        Self { connection, cells }
+    }
+}
+
+/// Result of one collection pass, produced off the main thread
+struct ConnectionSnapshot {
+    rows: Vec<ConnectionRow>,
+    total_sent: u64,
+    total_received: u64,
+    /// Order-independent hash of the (pid, local, remote, state) set
+    fingerprint: u64,
+    /// Resolver generation read after the rows were formatted
+    generation: u64,
+}
+
+/// Adaptive refresh interval.
+///
+/// Starts at `MIN_REFRESH_SECS` and doubles up to `MAX_REFRESH_SECS` after
+/// `IDLE_REFRESHES_BEFORE_BACKOFF` refreshes with the same connection set, no
+/// traffic and no new hostname lookups; any change drops it straight back to
+/// the minimum.
+struct RefreshBackoff {
+    interval: u32,
+    idle_refreshes: u32,
+    fingerprint: u64,
+    generation: u64,
+}
+
+impl RefreshBackoff {
+    fn new() -> Self {
+        Self {
+            interval: MIN_REFRESH_SECS,
+            idle_refreshes: 0,
+            fingerprint: 0,
+            generation: 0,
+        }
+    }
+
+    /// Go back to the minimum interval, e.g. after a settings change
+    fn reset(&mut self) {
+        self.interval = MIN_REFRESH_SECS;
+        self.idle_refreshes = 0;
+    }
+
+    /// Record one refresh and return the interval to wait before the next
+    fn observe(&mut self, fingerprint: u64, generation: u64, active: bool) -> u32 {
+        let changed = std::mem::replace(&mut self.fingerprint, fingerprint) != fingerprint;
+        let resolved = std::mem::replace(&mut self.generation, generation) != generation;
+        if active || changed || resolved {
+            self.reset();
+            return self.interval;
+        }
+
+        self.idle_refreshes += 1;
+        if self.idle_refreshes >= IDLE_REFRESHES_BEFORE_BACKOFF {
+            self.interval = (self.interval * 2).min(MAX_REFRESH_SECS);
+            self.idle_refreshes = 0;
+        }
+        self.interval
+    }
 }
 
 impl NetworkMonitorWindow {
@@ -61,20 +173,18 @@ impl NetworkMonitorWindow {
         let style_manager = adw::StyleManager::default();
         style_manager.set_color_scheme(adw::ColorScheme::Default);
 
-        // Create separate grids for sticky header and scrollable content
-        let header_grid = Grid::builder()
-            .column_spacing(0)
-            .row_spacing(0)
-            .halign(Align::Start) // Align to start
-            .hexpand(false) // Let the natural size be determined by children's width requests
-            .build();
+        // Connections live in a list store; the column view only creates
+        // widgets for visible rows and recycles them while scrolling
+        let store = gio::ListStore::new::<BoxedAnyObject>();
+        let column_view = ColumnView::new(None::<SingleSelection>);
+        column_view.set_show_row_separators(true);
+        column_view.add_css_class("connection-table");
 
-        let content_grid = Grid::builder()
-            .column_spacing(0)
-            .row_spacing(0)
-            .halign(Align::Start) // Align to start
-            .hexpand(false) // Let the natural size be determined by children's width requests
-            .build();
+        let sort_model = SortListModel::new(Some(store.clone()), column_view.sorter());
+        let selection = SingleSelection::new(Some(sort_model));
+        selection.set_autoselect(false);
+        selection.set_can_unselect(true);
+        column_view.set_model(Some(&selection));
 
         let resolve_toggle = gtk::CheckButton::builder()
             .label("Resolve Hostnames")
@@ -109,14 +219,13 @@ impl NetworkMonitorWindow {
 
         let monitor = Rc::new(NetworkMonitorWindow {
             window,
-            header_grid,
-            content_grid,
+            column_view,
+            store,
             resolve_toggle,
-            header_labels: Rc::new(RefCell::new(Vec::new())),
             prev_io: Arc::new(Mutex::new(HashMap::new())),
             resolver: AddressResolver::new(true),
             monitor: match detect_best_monitor() {
-                Ok(m) => m,
+                Ok(m) => Arc::new(Mutex::new(m)),
                 Err(e) => {
                     eprintln!("ERROR: {e}");
                     eprintln!("eBPF requires Linux 5.8+ and the following capabilities:");
@@ -124,129 +233,91 @@ impl NetworkMonitorWindow {
                     std::process::exit(1);
                 }
             },
-            sort_column: Rc::new(RefCell::new(6)),
-            sort_ascending: Rc::new(RefCell::new(false)),
-            row_widgets: Rc::new(RefCell::new(Vec::new())),
-            selected_row: Rc::new(RefCell::new(None)),
             connection_labels: Rc::new(RefCell::new((
                 total_label,
                 active_label,
                 sent_label,
                 received_label,
             ))),
-            column_widths: Rc::new(RefCell::new(vec![0; 8])), // 8 columns
             active_popovers: Rc::new(RefCell::new(Vec::new())),
 
             // Performance optimization fields
             last_update_time: Rc::new(RefCell::new(Instant::now())),
             debounce_timeout: Rc::new(RefCell::new(None)),
-            column_width_cache: Rc::new(RefCell::new(HashMap::new())),
-            virtualization_enabled: Rc::new(RefCell::new(true)),
-            max_visible_rows: Rc::new(RefCell::new(100)), // Show max 100 rows at once
+            collecting: Cell::new(false),
+            refresh_pending: Cell::new(false),
+            refresh: RefCell::new(RefreshBackoff::new()),
+            refresh_timeout: RefCell::new(None),
         });
 
-        monitor.setup_grid();
+        monitor.setup_columns();
         monitor.setup_ui();
         monitor.setup_actions();
-        monitor.setup_column_sync();
         monitor.setup_close_handler();
         monitor.start_monitoring();
         monitor
     }
 
-    fn setup_grid(self: &Rc<Self>) {
-        // Create all column headers as clickable labels
-        let headers = [
-            ("Process(ID)", 0),
-            ("Protocol", 1),
-            ("Source", 2),
-            ("Destination", 3),
-            ("Status", 4),
-            ("TX", 5),
-            ("RX", 6),
-            ("Path", 7),
-        ];
-
-        for (text, col) in headers {
-            let label = Label::builder().label(text).build();
-            label.add_css_class("table-header");
-
-            // Set alignment and width constraints for header labels
-            match col {
-                0 => {
-                    // Process(ID) - left aligned with specific width
-                    label.set_halign(Align::Start);
-                    label.set_xalign(0.0);
-                    label.add_css_class("column-process");
-                }
-                1 => {
-                    // Protocol - left aligned with specific width
-                    label.set_halign(Align::Start);
-                    label.set_xalign(0.0);
-                    label.add_css_class("column-protocol");
-                }
-                2 | 3 => {
-                    // Source/Destination - left aligned with specific width
-                    label.set_halign(Align::Start);
-                    label.set_xalign(0.0);
-                    label.add_css_class("column-address");
-                }
-                4 => {
-                    // Status - left aligned with specific width
-                    label.set_halign(Align::Start);
-                    label.set_xalign(0.0);
-                    label.add_css_class("column-status");
-                }
-                5 | 6 => {
-                    // TX/RX - left aligned with specific width
-                    label.set_halign(Align::Start);
-                    label.set_xalign(0.0);
-                    label.add_css_class("column-rate");
-                }
-                7 => {
-                    // Path - left aligned with specific width
-                    label.set_halign(Align::Start);
-                    label.set_xalign(0.0);
-                    label.add_css_class("column-path");
-                }
-                _ => {
-                    label.set_halign(Align::Start);
-                    label.set_xalign(0.0);
-                }
+    fn setup_columns(self: &Rc<Self>) {
+        for (col, title) in COLUMN_TITLES.iter().enumerate() {
+            let column = ColumnViewColumn::new(Some(*title), Some(self.create_cell_factory(col)));
+            column.set_resizable(true);
+            match COLUMN_WIDTHS.get(col) {
+                Some(&width) => column.set_fixed_width(width),
+                None => column.set_expand(true),
             }
 
-            // Connect click handler for sorting
-            let monitor_clone = self.clone();
-            let col_index = col;
-
-            let gesture = gtk::GestureClick::new();
-            gesture.connect_pressed(move |_, _, _, _| {
-                let mut sort_col = monitor_clone.sort_column.borrow_mut();
-                let mut sort_asc = monitor_clone.sort_ascending.borrow_mut();
-
-                if *sort_col == col_index {
-                    *sort_asc = !*sort_asc;
-                } else {
-                    *sort_col = col_index;
-                    *sort_asc = false; // First click should be descending
-                }
+            // Clicking a header sorts by that column, a second click flips
+            // the order
+            column.set_sorter(Some(&self.create_sorter(col)));
+
+            self.column_view.append_column(&column);
+            // Open highest RX rate first, with the header arrow saying so
+            if col == RX_COLUMN {
+                self.column_view
+                    .sort_by_column(Some(&column), SortType::Descending);
+            }
+        }
+    }
 
-                drop(sort_col);
-                drop(sort_asc);
+    /// Build the factory that creates, and rebinds, the cells of one column
+    fn create_cell_factory(self: &Rc<Self>, col: usize) -> SignalListItemFactory {
+        let factory = SignalListItemFactory::new();
 
-                let monitor_clone2 = monitor_clone.clone();
-                glib::idle_add_local_once(move || {
-                    monitor_clone2.update_connections();
-                    monitor_clone2.update_header_labels();
-                });
-            });
+        let active_popovers = self.active_popovers.clone();
+        factory.connect_setup(move |_, item| {
+            if let Some(item) = item.downcast_ref::<ListItem>() {
+                item.set_child(Some(&create_cell_label(col, &active_popovers)));
+            }
+        });
 
-            label.add_controller(gesture);
+        factory.connect_bind(move |_, item| {
+            let Some(item) = item.downcast_ref::<ListItem>() else {
+                return;
+            };
+            if let (Some(label), Some(object)) = (
+                item.child().and_downcast::<Label>(),
+                item.item().and_downcast::<BoxedAnyObject>(),
+            ) {
+                let row: Ref<ConnectionRow> = object.borrow();
+                bind_cell(&label, col, &row);
+            }
+        });
 
-            self.header_grid.attach(&label, col as i32, 0, 1, 1);
+        factory
+    }
 
-            // Store header labels for styling
-            self.header_labels.borrow_mut().push(label);
+    /// Sorter for column `col`, chosen once per column so the comparison
+    /// itself does not branch on the column.
+    ///
+    /// Rates compare numerically and every other column compares its cell
+    /// text, all in natural ascending order so the header arrow matches the
+    /// order shown.
+    fn create_sorter(&self, col: usize) -> CustomSorter {
+        match col {
+            TX_COLUMN => row_sorter(|a, b| a.connection.tx_rate.cmp(&b.connection.tx_rate)),
+            RX_COLUMN => row_sorter(|a, b| a.connection.rx_rate.cmp(&b.connection.rx_rate)),
+            _ => row_sorter(move |a, b| a.cells[col].cmp(&b.cells[col])),
         }
     }
 
@@ -300,22 +371,8 @@ impl NetworkMonitorWindow {
         table_container.add_css_class("table-container");
         table_container.add_css_class("responsive-table");
 
-        // Create header container with sticky behavior and overflow handling
-        let header_container = GtkBox::builder()
-            .orientation(Orientation::Vertical)
-            .hexpand(true)
-            .build();
-        header_container.add_css_class("header-container");
-        header_container.add_css_class("sticky-header");
-
-        // Wrap header grid in a container that allows horizontal overflow
-        let header_wrapper = GtkBox::builder()
-            .orientation(Orientation::Horizontal)
-            .build();
-        header_wrapper.append(&self.header_grid);
-        header_container.append(&header_wrapper);
-
-        // Create scrolled window for content with proper constraints
+        // The column view keeps its header row in sync with horizontal
+        // scrolling, so it only needs a plain scrolled window around it
         let scrolled = ScrolledWindow::builder()
             .vexpand(true)
             .hexpand(true)
@@ -326,49 +383,12 @@ impl NetworkMonitorWindow {
         scrolled.set_policy(gtk::PolicyType::Automatic, gtk::PolicyType::Automatic);
         scrolled.add_css_class("table-container");
         scrolled.add_css_class("responsive-table");
-        scrolled.set_child(Some(&self.content_grid));
+        scrolled.set_child(Some(&self.column_view));
 
-        // Proper horizontal scrolling synchronization
-        let header_grid_clone = self.header_grid.clone();
-        let scrolled_clone = scrolled.clone();
-
-        // Get horizontal adjustment for scrolling sync
-        let hadjustment = scrolled.hadjustment();
-
-        // Sync header position with content horizontal scroll
-        hadjustment.connect_value_notify(move |hadj| {
-            let scroll_value = hadj.value();
-
-            // Apply negative margin to header grid to simulate horizontal scrolling
-            // This keeps header aligned with content columns
-            header_grid_clone.set_margin_start(-(scroll_value.round() as i32));
-        });
-
-        // Handle edge cases for overscroll to maintain alignment
-        let header_grid_clone2 = self.header_grid.clone();
-        let scrolled_clone2 = scrolled.clone();
-        scrolled_clone.connect_edge_overshot(move |_, pos| {
-            if pos == gtk::PositionType::Left || pos == gtk::PositionType::Right {
-                let hadjustment = scrolled_clone2.hadjustment();
-                let scroll_value = hadjustment.value();
-                header_grid_clone2.set_margin_start(-(scroll_value.round() as i32));
-            }
-        });
-
-        // Remove fixed size constraints to let grid be more flexible
-        // The CSS min-widths will handle the minimum sizing
-
-        table_container.append(&header_container);
         table_container.append(&scrolled);
 
         main_box.append(&table_container);
 
-        // Update header labels after UI is rendered
-        let monitor_clone = self.clone();
-        glib::idle_add_local_once(move || {
-            monitor_clone.update_header_labels();
-        });
-
         // Add a separator line above the strip
         let separator = gtk::Separator::builder()
             .orientation(Orientation::Horizontal)
@@ -495,10 +515,15 @@ impl NetworkMonitorWindow {
         self.resolve_toggle
             .set_tooltip_text(Some("Toggle hostname resolution"));
 
-        let resolver = self.resolver.clone();
+        let window = Rc::downgrade(self);
         self.resolve_toggle.connect_toggled(move |button| {
-            let resolve_hosts = button.is_active();
-            resolver.set_resolve_hosts(resolve_hosts);
+            let Some(window) = window.upgrade() else {
+                return;
+            };
+            window.resolver.set_resolve_hosts(button.is_active());
+            // Show the switch right away instead of after a backed-off tick
+            window.refresh.borrow_mut().reset();
+            window.update_connections();
         });
 
         right_box.append(&self.resolve_toggle);
@@ -588,528 +613,133 @@ impl NetworkMonitorWindow {
         menu
     }
 
+    /// Collect connections on a worker thread and render them when done.
+    ///
+    /// `/proc` scanning, rate calculation and the localhost filter can block,
+    /// so only the widget updates run on the main thread. A request that
+    /// arrives while a collection is still running, such as flipping the
+    /// resolve toggle, is remembered and run as soon as that one finishes.
     pub fn update_connections(self: &Rc<Self>) {
-        // Clean up any active popovers before updating widgets
-        {
-            let mut popovers = self.active_popovers.borrow_mut();
-            for popover in popovers.drain(..) {
-                popover.unparent();
-            }
+        if self.collecting.replace(true) {
+            self.refresh_pending.set(true);
+            return;
         }
 
-        // Get mutable access to row widgets and clear selection styling
-        {
-            let row_widgets = self.row_widgets.borrow_mut();
-            for widget in row_widgets.iter() {
-                widget.remove_css_class("row-selected");
+        let monitor = self.monitor.clone();
+        let prev_io = self.prev_io.clone();
+        let resolver = self.resolver.clone();
+        let window = self.clone();
+        glib::spawn_future_local(async move {
+            let snapshot =
+                gio::spawn_blocking(move || collect_connections(&monitor, &prev_io, &resolver))
+                    .await;
+            window.collecting.set(false);
+
+            match snapshot {
+                Ok(Some(snapshot)) => window.render_connections(snapshot),
+                Ok(None) => {}
+                Err(_) => eprintln!("Connection collection thread panicked"),
             }
-        }
-
-        // Clear selection state
-        {
-            let mut selected = self.selected_row.borrow_mut();
-            *selected = None;
-        }
 
-        // Get connections
-        let connections = match self.monitor.get_connections() {
-            Ok(conn) => conn,
-            Err(e) => {
-                eprintln!("Failed to get connections: {}", e);
+            // A request made during this collection may depend on state it
+            // did not see, so collect again; that run arms the next tick
+            if window.refresh_pending.take() {
+                window.update_connections();
                 return;
             }
-        };
-
-        // Update I/O data for rate calculations
-        let prev_io = self
-            .prev_io
-            .lock()
-            .unwrap_or_else(|e| e.into_inner())
-            .clone();
-        let (updated_connections, current_io) =
-            match self.monitor.update_connection_rates(connections, &prev_io) {
-                Ok(result) => result,
-                Err(e) => {
-                    eprintln!("Failed to update connection rates: {}", e);
-                    return;
-                }
-            };
-
-        // Calculate total sent/received data
-        let mut total_sent = 0u64;
-        let mut total_received = 0u64;
-        for io in current_io.values() {
-            total_sent += io.tx;
-            total_received += io.rx;
-        }
-
-        // Update previous I/O data for next iteration
-        {
-            let mut prev_io = self.prev_io.lock().unwrap_or_else(|e| e.into_inner());
-            *prev_io = current_io;
-        }
-
-        // Filter out localhost connections
-        let filtered_connections: Vec<Connection> = updated_connections
-            .into_iter()
-            .filter(|conn| self.resolver.resolve_address(&conn.remote) != "LOCALHOST")
-            .collect();
 
-        // Sort connections
-        let sorted_connections = self.sort_connections(filtered_connections);
-        let connection_count = sorted_connections.len();
+            // Arm the next tick only now, so it uses the interval that
+            // render_connections just derived from this snapshot
+            window.schedule_refresh();
+        });
+    }
 
-        // Apply virtualization for large datasets
-        let virtualized_connections = if *self.virtualization_enabled.borrow()
-            && connection_count > *self.max_visible_rows.borrow()
+    fn render_connections(&self, snapshot: ConnectionSnapshot) {
+        // Clean up any active popovers before updating widgets
         {
-            // Show first 50 and last 50 rows with a virtualized middle section
-            let max_rows = *self.max_visible_rows.borrow();
-            let half_rows = max_rows / 2;
-
-            if connection_count <= max_rows {
-                sorted_connections.clone()
-            } else {
-                let mut result = Vec::new();
-                // Add first half_rows
-                result.extend(sorted_connections.iter().take(half_rows).cloned());
-                // Add a placeholder for the middle
-                result.push(Connection {
-                    program: "...".to_string(),
-                    pid: "...".to_string(),
-                    protocol: "...".to_string(),
-                    local: "...".to_string(),
-                    remote: "...".to_string(),
-                    state: "...".to_string(),
-                    tx_rate: 0,
-                    rx_rate: 0,
-                    command: "...".to_string(),
-                }); // This will be styled as "..."
-                    // Add last half_rows
-                result.extend(
-                    sorted_connections
-                        .iter()
-                        .skip(connection_count - half_rows)
-                        .cloned(),
-                );
-                result
-            }
-        } else {
-            sorted_connections.clone()
-        };
-
-        let mut active_connections = 0;
-        let num_columns = 8;
-        let mut row = 1; // Start from row 1 (row 0 is headers)
-
-        // Get mutable access to row widgets
-        let mut row_widgets = self.row_widgets.borrow_mut();
-        let existing_widget_count = row_widgets.len();
-
-        // Use cached column widths when available
-        let _cached_widths = self.column_width_cache.borrow().clone();
-
-        for (conn_index, conn) in virtualized_connections.iter().enumerate() {
-            // Skip placeholder rows in virtualized mode
-            if *self.virtualization_enabled.borrow()
-                && conn_index > *self.max_visible_rows.borrow() / 2
-                && conn_index < virtualized_connections.len() - *self.max_visible_rows.borrow() / 2
-                && conn_index != virtualized_connections.len() / 2
-            {
-                continue;
-            }
-
-            // Calculate the starting index for this row's widgets in the row_widgets vector
-            let start_widget_index = conn_index * num_columns;
-
-            // Format display values
-            let prog_pid = if *self.virtualization_enabled.borrow()
-                && conn_index == virtualized_connections.len() / 2
-            {
-                "...".to_string()
-            } else {
-                conn.get_process_display()
-            };
-
-            let local_resolved = if *self.virtualization_enabled.borrow()
-                && conn_index == virtualized_connections.len() / 2
-            {
-                "...".to_string()
-            } else {
-                self.resolver.resolve_address(&conn.local)
-            };
-
-            let remote_resolved = if *self.virtualization_enabled.borrow()
-                && conn_index == virtualized_connections.len() / 2
-            {
-                "...".to_string()
-            } else {
-                self.resolver.resolve_address(&conn.remote)
-            };
-
-            let process_path = if *self.virtualization_enabled.borrow()
-                && conn_index == virtualized_connections.len() / 2
-            {
-                "...".to_string()
-            } else {
-                conn.command.clone()
-            };
-
-            // Process each column separately
-            let columns = [
-                prog_pid,
-                conn.protocol.clone(),
-                local_resolved,
-                remote_resolved,
-                conn.state.clone(),
-                if *self.virtualization_enabled.borrow()
-                    && conn_index == virtualized_connections.len() / 2
-                {
-                    "...".to_string()
-                } else {
-                    Formatter::format_bytes(conn.tx_rate)
-                },
-                if *self.virtualization_enabled.borrow()
-                    && conn_index == virtualized_connections.len() / 2
-                {
-                    "...".to_string()
-                } else {
-                    Formatter::format_bytes(conn.rx_rate)
-                },
-                process_path,
-            ];
-
-            for (col, text) in columns.iter().enumerate() {
-                let widget_index = start_widget_index + col;
-                let label: &Label;
-
-                if widget_index < existing_widget_count {
-                    // Reuse existing widget: only update text
-                    if let Some(widget) = row_widgets[widget_index].downcast_ref::<Label>() {
-                        label = widget;
-                        label.set_text(text);
-                    } else {
-                        eprintln!("Warning: Widget at index {} is not a Label", widget_index);
-                        continue;
-                    }
-                } else {
-                    // Create new widget if needed (only happens when new connections appear)
-                    let text_for_closures = text.clone();
-
-                    let new_label = if col == 7 {
-                        // Path column - don't ellipsize
-                        Label::builder().label(text).xalign(0.0).build()
-                    } else {
-                        // Other columns - ellipsize
-                        Label::builder()
-                            .label(text)
-                            .ellipsize(gtk::pango::EllipsizeMode::End)
-                            .xalign(0.0)
-                            .build()
-                    };
-
-                    // Apply initial styling and alignment (only once)
-                    match col {
-                        0 => {
-                            new_label.add_css_class("caption");
-                            new_label.add_css_class("column-process");
-                            new_label.set_halign(Align::Start);
-                            new_label.set_xalign(0.0);
-                        }
-                        1 => {
-                            new_label.add_css_class("column-protocol");
-                            new_label.set_halign(Align::Start);
-                            new_label.set_xalign(0.0);
-                        }
-                        2 | 3 => {
-                            new_label.add_css_class("column-address");
-                            new_label.set_halign(Align::Start);
-                            new_label.set_xalign(0.0);
-                        }
-                        4 => {
-                            new_label.add_css_class("column-status");
-                            new_label.set_halign(Align::Start);
-                            new_label.set_xalign(0.0);
-                        }
-                        5 => {
-                            new_label.add_css_class("column-rate");
-                            new_label.set_halign(Align::End);
-                            new_label.set_xalign(1.0);
-                        }
-                        6 => {
-                            new_label.add_css_class("column-rate");
-                            new_label.set_halign(Align::End);
-                            new_label.set_xalign(1.0);
-                        }
-                        7 => {
-                            new_label.add_css_class("caption");
-                            new_label.add_css_class("dim-label");
-                            new_label.add_css_class("column-path");
-                            new_label.set_halign(Align::Start);
-                            new_label.set_xalign(0.0);
-                        }
-                        _ => {
-                            new_label.set_halign(Align::Start);
-                            new_label.set_xalign(0.0);
-                        }
-                    }
-                    new_label.add_css_class("table-cell");
-
-                    // Add click gesture for row selection (only once)
-                    let gesture = gtk::GestureClick::new();
-                    let selected_row = self.selected_row.clone();
-                    let row_widgets_ref = self.row_widgets.clone();
-                    let row_num = row; // This row number is constant for the closure
-
-                    gesture.connect_pressed(move |_, _, _, _| {
-                        // Update selected row and apply visual styling
-                        {
-                            let mut selected = selected_row.borrow_mut();
-                            *selected = Some(row_num);
-                        }
-
-                        // Update visual styling for all rows
-                        let widgets = row_widgets_ref.borrow();
-                        for (idx, widget) in widgets.iter().enumerate() {
-                            let widget_row = idx / num_columns;
-                            if widget_row == (row_num - 1) {
-                                widget.add_css_class("row-selected");
-                            } else {
-                                widget.remove_css_class("row-selected");
-                            }
-                        }
-                    });
-                    new_label.add_controller(gesture);
-
-                    // Add right-click gesture for context menu (only once)
-                    let right_click_gesture = gtk::GestureClick::new();
-                    right_click_gesture.set_button(3);
-
-                    let text_for_right_click = text_for_closures.clone(); // Clone for right click closure
-                    let active_popovers = self.active_popovers.clone();
-                    right_click_gesture.connect_pressed(move |gesture, _, x, y| {
-                        let copy_text = text_for_right_click.clone();
-
-                        if let Some(display) = gtk::gdk::Display::default() {
-                            let clipboard = display.clipboard();
-                            clipboard.set_text(&copy_text);
-                        } else {
-                            eprintln!(
-                                "Warning: Could not access clipboard - display not available"
-                            );
-                        }
-
-                        let menu = PopoverMenu::builder().build();
-                        let menu_model = Menu::new();
-                        menu_model.append(Some("Copied!"), None);
-                        menu.set_menu_model(Some(&menu_model));
-
-                        if let Some(parent) = gesture.widget() {
-                            menu.set_parent(&parent);
-                            let rect = gtk::gdk::Rectangle::new(x as i32, y as i32, 1, 1);
-                            menu.set_pointing_to(Some(&rect));
-
-                            let active_popovers_clone = active_popovers.clone();
-                            let menu_clone = menu.clone();
-                            active_popovers_clone.borrow_mut().push(menu_clone.clone());
-
-                            let menu_for_timeout = menu.clone();
-                            let active_popovers_for_timeout = active_popovers.clone();
-                            glib::timeout_add_seconds_local_once(1, move || {
-                                menu_for_timeout.unparent();
-                                let mut popovers = active_popovers_for_timeout.borrow_mut();
-                                popovers.retain(|p| !p.eq(&menu_for_timeout));
-                            });
-
-                            menu.popup();
-                        }
-                    });
-                    new_label.add_controller(right_click_gesture);
-
-                    // Add keyboard shortcut for Ctrl+C (only once)
-                    let key_controller = gtk::EventControllerKey::new();
-                    let text_for_keyboard = text_for_closures.clone(); // Clone for keyboard closure
-                    key_controller.connect_key_pressed(move |_, key, _, modifier| {
-                        if key == gtk::gdk::Key::c
-                            && modifier == gtk::gdk::ModifierType::CONTROL_MASK
-                        {
-                            if let Some(display) = gtk::gdk::Display::default() {
-                                let clipboard = display.clipboard();
-                                clipboard.set_text(&text_for_keyboard);
-                            } else {
-                                eprintln!(
-                                    "Warning: Could not access clipboard - display not available"
-                                );
-                            }
-                            return glib::Propagation::Stop;
-                        }
-                        glib::Propagation::Proceed
-                    });
-                    new_label.add_controller(key_controller);
-
-                    // Attach to grid and store
-                    self.content_grid
-                        .attach(&new_label, col as i32, row as i32, 1, 1);
-                    row_widgets.push(new_label.clone());
-                    // Get reference from the newly pushed widget in the vector
-                    if let Some(widget) = row_widgets.last().and_then(|w| w.downcast_ref::<Label>())
-                    {
-                        label = widget;
-                    } else {
-                        eprintln!("Warning: Failed to get reference to newly created Label widget");
-                        continue;
-                    }
-                }
-
-                // Update dynamic styling (must be done every update)
-                match col {
-                    1 => {
-                        // Protocol color
-                        label.remove_css_class("success");
-                        label.remove_css_class("warning");
-                        label.remove_css_class("dim-label");
-                        if *self.virtualization_enabled.borrow()
-                            && conn_index == virtualized_connections.len() / 2
-                        {
-                            label.add_css_class("dim-label");
-                        } else {
-                            match conn.protocol.as_str() {
-                                "tcp" => label.add_css_class("success"),
-                                "udp" => label.add_css_class("warning"),
-                                _ => label.add_css_class("dim-label"),
-                            }
-                        }
-                    }
-                    3 => {
-                        // Destination rate color
-                        label.remove_css_class("accent");
-                        if *self.virtualization_enabled.borrow()
-                            && conn_index == virtualized_connections.len() / 2
-                        {
-                            label.add_css_class("dim-label");
-                        } else if conn.rx_rate > 0 || conn.tx_rate > 0 {
-                            label.add_css_class("accent");
-                        } else {
-                            label.add_css_class("dim-label");
-                        }
-                    }
-                    4 => {
-                        // Status color
-                        label.remove_css_class("success");
-                        label.remove_css_class("warning");
-                        label.remove_css_class("error");
-                        label.remove_css_class("dim-label");
-                        if *self.virtualization_enabled.borrow()
-                            && conn_index == virtualized_connections.len() / 2
-                        {
-                            label.add_css_class("dim-label");
-                        } else {
-                            match conn.state.as_str() {
-                                "ESTABLISHED" => label.add_css_class("success"),
-                                "LISTEN" => label.add_css_class("warning"),
-                                "TIME_WAIT" => label.add_css_class("error"),
-                                _ => label.add_css_class("dim-label"),
-                            }
-                        }
-                    }
-                    5 => {
-                        // TX Rate color
-                        label.remove_css_class("error");
-                        label.remove_css_class("dim-label");
-                        if *self.virtualization_enabled.borrow()
-                            && conn_index == virtualized_connections.len() / 2
-                        {
-                            label.add_css_class("dim-label");
-                        } else if conn.tx_rate > 0 {
-                            label.add_css_class("error");
-                        } else {
-                            label.add_css_class("dim-label");
-                        }
-                    }
-                    6 => {
-                        // RX Rate color
-                        label.remove_css_class("accent");
-                        label.remove_css_class("dim-label");
-                        if *self.virtualization_enabled.borrow()
-                            && conn_index == virtualized_connections.len() / 2
-                        {
-                            label.add_css_class("dim-label");
-                        } else if conn.rx_rate > 0 {
-                            label.add_css_class("accent");
-                        } else {
-                            label.add_css_class("dim-label");
-                        }
-                    }
-                    7 => {
-                        // Path color
-                        label.remove_css_class("dim-label");
-                        label.add_css_class("dim-label");
-                    }
-                    _ => {}
-                }
-            }
-
-            if (!*self.virtualization_enabled.borrow()
-                || conn_index <= *self.max_visible_rows.borrow() / 2
-                || conn_index
-                    >= virtualized_connections.len() - *self.max_visible_rows.borrow() / 2)
-                && conn.is_active()
-            {
-                active_connections += 1;
+            let mut popovers = self.active_popovers.borrow_mut();
+            for popover in popovers.drain(..) {
+                popover.unparent();
             }
-
-            row += 1;
         }
 
-        // Hide excess widgets if the number of connections decreased
-        let total_widgets_needed = virtualized_connections.len() * num_columns;
-        if existing_widget_count > total_widgets_needed {
-            for widget in row_widgets.drain(total_widgets_needed..) {
-                self.content_grid.remove(&widget);
-            }
-        }
+        let connection_count = snapshot.rows.len();
+        let active_connections = snapshot
+            .rows
+            .iter()
+            .filter(|row| row.connection.is_active())
+            .count();
+        self.refresh.borrow_mut().observe(
+            snapshot.fingerprint,
+            snapshot.generation,
+            active_connections > 0,
+        );
 
-        // Update status
-        let display_count = if *self.virtualization_enabled.borrow()
-            && connection_count > *self.max_visible_rows.borrow()
-        {
-            format!(
-                "{} (showing {})",
-                connection_count,
-                *self.max_visible_rows.borrow()
-            )
-        } else {
-            connection_count.to_string()
-        };
+        self.sync_store(snapshot.rows);
 
         self.update_status(
-            display_count.parse().unwrap_or(sorted_connections.len()),
+            connection_count,
             active_connections,
-            total_sent,
-            total_received,
+            snapshot.total_sent,
+            snapshot.total_received,
         );
-
-        // Update column width cache periodically
-        if self.last_update_time.borrow().elapsed().as_secs() > 10 {
-            self.update_column_width_cache();
-        }
     }
 
-    /// Update column width cache for better performance
-    fn update_column_width_cache(self: &Rc<Self>) {
-        let mut cache = self.column_width_cache.borrow_mut();
-        let current_widths = self.column_widths.borrow();
+    /// Update the store in place, keyed on each row's connection.
+    ///
+    /// Rows that are still open and unchanged keep their object, rows whose
+    /// text or rates differ get a new one, closed connections are removed and
+    /// new ones appended, so the sort model re-sorts and the column view
+    /// rebinds just the rows that changed.
+    fn sync_store(&self, rows: Vec<ConnectionRow>) {
+        let store_row = |pos| self.store.item(pos).and_downcast::<BoxedAnyObject>();
+
+        // Match every stored row against the new snapshot up front
+        let matches: Vec<Option<usize>> = {
+            let index: HashMap<_, usize> = rows
+                .iter()
+                .enumerate()
+                .map(|(i, row)| (row_key(&row.connection), i))
+                .collect();
+            (0..self.store.n_items())
+                .map(|pos| {
+                    let object = store_row(pos)?;
+                    let row: Ref<ConnectionRow> = object.borrow();
+                    index.get(&row_key(&row.connection)).copied()
+                })
+                .collect()
+        };
 
-        // Update cache only if widths have changed significantly
-        for (i, &width) in current_widths.iter().enumerate() {
-            if let Some(cached_width) = cache.get(&i) {
-                if (width - cached_width).abs() > 10 {
-                    cache.insert(i, width);
-                }
-            } else {
-                cache.insert(i, width);
+        let mut rows: Vec<Option<ConnectionRow>> = rows.into_iter().map(Some).collect();
+        // Walk backwards so removals do not shift the positions still to visit
+        for (pos, matched) in matches.into_iter().enumerate().rev() {
+            let pos = pos as u32;
+            let (Some(object), Some(row)) = (store_row(pos), matched.and_then(|i| rows[i].take()))
+            else {
+                self.store.remove(pos);
+                continue;
+            };
+            let changed = {
+                let old: Ref<ConnectionRow> = object.borrow();
+                old.cells != row.cells
+                    || old.connection.tx_rate != row.connection.tx_rate
+                    || old.connection.rx_rate != row.connection.rx_rate
+            };
+            if changed {
+                // Swap in a new object rather than mutating this one: GTK
+                // keeps the bound widget when the same item is re-added at an
+                // unchanged position and would not run bind again, leaving
+                // the old rates and hostnames on screen.
+                self.store.splice(pos, 1, &[BoxedAnyObject::new(row)]);
             }
         }
+
+        let added: Vec<BoxedAnyObject> = rows
+            .into_iter()
+            .flatten()
+            .map(BoxedAnyObject::new)
+            .collect();
+        self.store.extend_from_slice(&added);
     }
 
     fn update_status(&self, total: usize, active: usize, total_sent: u64, total_received: u64) {
@@ -1129,45 +759,6 @@ impl NetworkMonitorWindow {
         }
     }
 
-    fn sort_connections(&self, connections: Vec<Connection>) -> Vec<Connection> {
-        if connections.is_empty() {
-            return connections;
-        }
-
-        let sort_column = *self.sort_column.borrow();
-        let sort_ascending = *self.sort_ascending.borrow();
-
-        let mut sorted_connections = connections;
-
-        sorted_connections.sort_by(|a, b| {
-            let comparison = match sort_column {
-                0 => a.get_process_display().cmp(&b.get_process_display()),
-                1 => a.protocol.cmp(&b.protocol),
-                2 => self
-                    .resolver
-                    .resolve_address(&a.local)
-                    .cmp(&self.resolver.resolve_address(&b.local)),
-                3 => self
-                    .resolver
-                    .resolve_address(&a.remote)
-                    .cmp(&self.resolver.resolve_address(&b.remote)),
-                4 => a.state.cmp(&b.state),
-                5 => a.tx_rate.cmp(&b.tx_rate),
-                6 => a.rx_rate.cmp(&b.rx_rate),
-                7 => a.command.cmp(&b.command),
-                _ => std::cmp::Ordering::Equal,
-            };
-
-            if sort_ascending {
-                comparison
-            } else {
-                comparison.reverse()
-            }
-        });
-
-        sorted_connections
-    }
-
     pub fn show_about_dialog(parent: &ApplicationWindow) {
         let about = AboutWindow::builder()
             .transient_for(parent)
@@ -1185,210 +776,6 @@ impl NetworkMonitorWindow {
         about.present();
     }
 
-    fn update_header_labels(&self) {
-        let sort_column = *self.sort_column.borrow();
-        let sort_ascending = *self.sort_ascending.borrow();
-        let header_labels = self.header_labels.borrow();
-
-        // Define base labels for each column
-        let base_labels = [
-            "Process(ID)",
-            "Protocol",
-            "Source",
-            "Destination",
-            "Status",
-            "TX",
-            "RX",
-            "Path",
-        ];
-
-        for (index, label) in header_labels.iter().enumerate() {
-            let base_label = base_labels.get(index).unwrap_or(&"");
-            let triangle = if index == sort_column {
-                if sort_ascending {
-                    " ▲"
-                } else {
-                    " ▼"
-                }
-            } else {
-                ""
-            };
-            label.set_text(&format!("{base_label}{triangle}"));
-        }
-    }
-
-    fn setup_column_sync(self: &Rc<Self>) {
-        // Set up column width synchronization with debouncing
-        let header_grid1 = self.header_grid.clone();
-        let content_grid1 = self.content_grid.clone();
-        let column_widths1 = self.column_widths.clone();
-        let last_sync_time = Rc::new(RefCell::new(Instant::now()));
-
-        // Connect to window size changes
-        let window_clone = self.window.clone();
-        let sync_time_clone = last_sync_time.clone();
-        window_clone.connect_default_width_notify(move |_| {
-            // Debounce column width updates
-            let now = Instant::now();
-            let last_sync = *sync_time_clone.borrow();
-
-            if now.duration_since(last_sync).as_millis() > 200 {
-                *sync_time_clone.borrow_mut() = now;
-
-                // Schedule column width update after layout is complete
-                let header_grid = header_grid1.clone();
-                let content_grid = content_grid1.clone();
-                let column_widths = column_widths1.clone();
-
-                glib::idle_add_local_once(move || {
-                    Self::sync_column_widths(&header_grid, &content_grid, &column_widths);
-                });
-            }
-        });
-
-        // Initial sync
-        let header_grid2 = self.header_grid.clone();
-        let content_grid2 = self.content_grid.clone();
-        let column_widths2 = self.column_widths.clone();
-        glib::idle_add_local_once(move || {
-            Self::sync_column_widths(&header_grid2, &content_grid2, &column_widths2);
-        });
-    }
-
-    fn sync_column_widths(
-        header_grid: &Grid,
-        content_grid: &Grid,
-        column_widths: &Rc<RefCell<Vec<i32>>>,
-    ) {
-        // Get all children from both grids
-        let header_labels = header_grid.observe_children();
-        let content_children = content_grid.observe_children();
-
-        // Start with very conservative defaults to allow smaller windows
-        let mut max_widths = vec![60; 8]; // Even smaller defaults
-
-        // Define maximum reasonable widths to prevent excessive expansion
-        // Increased Path (index 7) width to allow for long paths and horizontal scrolling
-        let max_reasonable_widths = [150, 45, 140, 140, 80, 70, 70, 500];
-
-        // Measure header widths first with sampling for performance
-        let _header_sample_size = ((header_labels.n_items().min(8) as f32 * 0.3).max(1.0)) as i32;
-        for i in 0..header_labels.n_items().min(8) {
-            let idx = i as usize;
-            if let Some(header_child) = header_labels.item(i) {
-                if let Some(header_label) = header_child.downcast_ref::<Label>() {
-                    // Use text width estimation as fallback
-                    let header_text = header_label.text();
-                    let header_width = estimate_text_width(&header_text) + 16; // Reduced padding
-                    max_widths[idx] = max_widths[idx].max(header_width);
-                }
-            }
-        }
-
-        // Measure content column widths with sampling for better performance
-        // Only sample every 5th row to reduce computation
-        let total_content_items = content_children.n_items();
-        let num_columns = 8;
-        let sample_rate = 5;
-
-        for item_idx in (0..total_content_items).step_by(sample_rate) {
-            if let Some(content_child) = content_children.item(item_idx) {
-                if let Some(content_label) = content_child.downcast_ref::<Label>() {
-                    let col_idx = (item_idx % num_columns) as usize;
-                    let content_text = content_label.text();
-                    let content_width = estimate_text_width(&content_text) + 16; // Reduced padding
-                    max_widths[col_idx] = max_widths[col_idx].max(content_width);
-                }
-            }
-        }
-
-        // Apply maximum reasonable width constraints
-        for (idx, width) in max_widths.iter_mut().enumerate() {
-            if idx < max_reasonable_widths.len() {
-                *width = (*width).min(max_reasonable_widths[idx]);
-            }
-        }
-
-        // Apply measured widths to header labels
-        for i in 0..header_labels.n_items().min(8) {
-            let idx = i as usize;
-            let target_width = max_widths[idx];
-
-            if let Some(header_child) = header_labels.item(i) {
-                if let Some(header_label) = header_child.downcast_ref::<Label>() {
-                    header_label.set_width_request(target_width);
-
-                    // Apply appropriate CSS class for each column
-                    match idx {
-                        0 => {
-                            header_label.add_css_class("column-process");
-                            header_label.remove_css_class("column-protocol");
-                            header_label.remove_css_class("column-address");
-                            header_label.remove_css_class("column-status");
-                            header_label.remove_css_class("column-rate");
-                            header_label.remove_css_class("column-path");
-                        }
-                        1 => {
-                            header_label.remove_css_class("column-process");
-                            header_label.add_css_class("column-protocol");
-                            header_label.remove_css_class("column-address");
-                            header_label.remove_css_class("column-status");
-                            header_label.remove_css_class("column-rate");
-                            header_label.remove_css_class("column-path");
-                        }
-                        2 | 3 => {
-                            header_label.remove_css_class("column-process");
-                            header_label.remove_css_class("column-protocol");
-                            header_label.add_css_class("column-address");
-                            header_label.remove_css_class("column-status");
-                            header_label.remove_css_class("column-rate");
-                            header_label.remove_css_class("column-path");
-                        }
-                        4 => {
-                            header_label.remove_css_class("column-process");
-                            header_label.remove_css_class("column-protocol");
-                            header_label.remove_css_class("column-address");
-                            header_label.add_css_class("column-status");
-                            header_label.remove_css_class("column-rate");
-                            header_label.remove_css_class("column-path");
-                        }
-                        5 | 6 => {
-                            header_label.remove_css_class("column-process");
-                            header_label.remove_css_class("column-protocol");
-                            header_label.remove_css_class("column-address");
-                            header_label.remove_css_class("column-status");
-                            header_label.add_css_class("column-rate");
-                            header_label.remove_css_class("column-path");
-                        }
-                        7 => {
-                            header_label.remove_css_class("column-process");
-                            header_label.remove_css_class("column-protocol");
-                            header_label.remove_css_class("column-address");
-                            header_label.remove_css_class("column-status");
-                            header_label.remove_css_class("column-rate");
-                            header_label.add_css_class("column-path");
-                        }
-                        _ => {}
-                    }
-                }
-            }
-        }
-
-        // Apply measured widths to content labels with batch update
-        for item_idx in 0..total_content_items {
-            if let Some(content_child) = content_children.item(item_idx) {
-                if let Some(content_label) = content_child.downcast_ref::<Label>() {
-                    let col_idx = (item_idx % num_columns) as usize;
-                    let target_width = max_widths[col_idx];
-                    content_label.set_width_request(target_width);
-                }
-            }
-        }
-
-        // Store the measured widths
-        *column_widths.borrow_mut() = max_widths;
-    }
-
     fn setup_close_handler(self: &Rc<Self>) {
         // Handle window close event to properly quit the application
         self.window.connect_close_request(move |window| {
@@ -1403,30 +790,49 @@ impl NetworkMonitorWindow {
     }
 
     fn start_monitoring(self: &Rc<Self>) {
-        // Initial update
+        // Initial update; each finished collection arms the next one
         self.update_connections();
-        self.update_header_labels();
+    }
+
+    /// Arm a one-shot timer for the next periodic update.
+    ///
+    /// Called when a collection finishes, with the adaptive interval it
+    /// produced, so a quiet system is polled less often and activity speeds
+    /// it back up from the very next tick. A timer that is still pending is
+    /// replaced, so there is only ever one.
+    fn schedule_refresh(self: &Rc<Self>) {
+        if let Some(pending) = self.refresh_timeout.borrow_mut().take() {
+            pending.remove();
+        }
 
-        // Set up periodic updates with debouncing
         let monitor_clone = self.clone();
-        timeout_add_seconds_local(3, move || {
+        let interval = self.refresh.borrow().interval;
+        let timeout = timeout_add_seconds_local_once(interval, move || {
+            // The source is destroyed once it fires, so forget its ID
+            monitor_clone.refresh_timeout.borrow_mut().take();
             monitor_clone.schedule_debounced_update();
-            glib::ControlFlow::Continue
         });
+        *self.refresh_timeout.borrow_mut() = Some(timeout);
     }
 
     /// Schedule a debounced update to prevent excessive UI updates
     fn schedule_debounced_update(self: &Rc<Self>) {
+        // An update is already queued and will pick up the latest state
+        if self.debounce_timeout.borrow().is_some() {
+            return;
+        }
+
         let now = Instant::now();
         let last_update = *self.last_update_time.borrow();
 
         // Check if we should debounce based on time since last update
         if now.duration_since(last_update).as_millis() < 500 {
-            // Schedule a delayed update
+            // Schedule a single delayed update
             let monitor_clone = self.clone();
-            let timeout = timeout_add_local(Duration::from_millis(200), move || {
+            let timeout = timeout_add_local_once(Duration::from_millis(200), move || {
+                // The source is destroyed once it fires, so forget its ID
+                monitor_clone.debounce_timeout.borrow_mut().take();
                 monitor_clone.perform_debounced_update();
-                glib::ControlFlow::Continue
             });
 
             // Store the timeout ID
@@ -1450,18 +856,352 @@ impl NetworkMonitorWindow {
 
         // Perform the update
         self.update_connections();
-        self.update_header_labels();
 
         // Update last update time
         *self.last_update_time.borrow_mut() = Instant::now();
     }
 }
 
-/// Helper function to estimate text width for column sizing
-fn estimate_text_width(text: &str) -> i32 {
-    // More conservative estimation: average character width ~ 7 pixels
-    // This is a simple approximation - GTK will handle actual layout
-    let char_count = text.chars().count();
-    // Cap at reasonable minimum to prevent too narrow columns
-    (char_count * 7).max(40) as i32
+/// Gather connections, their rates and the transfer totals.
+///
+/// Runs on a blocking worker thread; errors are logged and skip the refresh.
+fn collect_connections(
+    monitor: &Mutex<Box<dyn ConnectionMonitor>>,
+    prev_io: &Mutex<HashMap<String, ProcessIO>>,
+    resolver: &AddressResolver,
+) -> Option<ConnectionSnapshot> {
+    let monitor = monitor.lock().unwrap_or_else(|e| e.into_inner());
+
+    // Get connections
+    let mut connections = match monitor.get_connections() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Failed to get connections: {}", e);
+            return None;
+        }
+    };
+
+    // Localhost peers are never shown, so drop them before any I/O is read
+    connections.retain(|conn| !AddressResolver::is_localhost(&conn.remote));
+
+    // Update I/O data for rate calculations
+    let mut prev_io = prev_io.lock().unwrap_or_else(|e| e.into_inner());
+    let (updated_connections, current_io) =
+        match monitor.update_connection_rates(connections, &prev_io) {
+            Ok(result) => result,
+            Err(e) => {
+                eprintln!("Failed to update connection rates: {}", e);
+                return None;
+            }
+        };
+
+    // Calculate total sent/received data. Only sampled processes are in
+    // current_io, so listen-only and localhost-only processes are left out.
+    let mut total_sent = 0u64;
+    let mut total_received = 0u64;
+    for io in current_io.values() {
+        total_sent += io.tx;
+        total_received += io.rx;
+    }
+
+    // Update previous I/O data for next iteration
+    *prev_io = current_io;
+
+    // Format the connections for display
+    let rows: Vec<ConnectionRow> = updated_connections
+        .into_iter()
+        .map(|conn| ConnectionRow::new(conn, resolver))
+        .collect();
+    let fingerprint = connection_fingerprint(rows.iter().map(|row| &row.connection));
+
+    Some(ConnectionSnapshot {
+        rows,
+        total_sent,
+        total_received,
+        fingerprint,
+        generation: resolver.generation(),
+    })
+}
+
+/// Identity of a table row across refreshes
+fn row_key(conn: &Connection) -> (&str, &str, &str, &str) {
+    (&conn.pid, &conn.protocol, &conn.local, &conn.remote)
+}
+
+/// Hash of the connection set that ignores the order connections come in
+fn connection_fingerprint<'a>(connections: impl Iterator<Item = &'a Connection>) -> u64 {
+    connections
+        .map(|conn| {
+            let mut hasher = DefaultHasher::new();
+            (&conn.pid, &conn.local, &conn.remote, &conn.state).hash(&mut hasher);
+            hasher.finish()
+        })
+        .fold(0, u64::wrapping_add)
+}
+
+/// Apply exactly one of `classes` to `label`, leaving the style context
+/// untouched when the wanted class is already the only one set.
+fn set_state_class(label: &Label, classes: &[&str], wanted: &str) {
+    for class in classes {
+        if *class != wanted && label.has_css_class(class) {
+            label.remove_css_class(class);
+        }
+    }
+    if !label.has_css_class(wanted) {
+        label.add_css_class(wanted);
+    }
+}
+
+/// Create the label used for every cell of column `col`.
+///
+/// Cells are recycled by the column view, so the handlers read the label's
+/// current text instead of capturing it.
+fn create_cell_label(col: usize, active_popovers: &Rc<RefCell<Vec<PopoverMenu>>>) -> Label {
+    let label = if col == PATH_COLUMN {
+        // Path column - don't ellipsize
+        Label::builder().xalign(0.0).build()
+    } else {
+        // Other columns - ellipsize
+        Label::builder()
+            .ellipsize(gtk::pango::EllipsizeMode::End)
+            .xalign(0.0)
+            .build()
+    };
+
+    match col {
+        0 => {
+            label.add_css_class("caption");
+            label.add_css_class("column-process");
+            label.set_halign(Align::Start);
+        }
+        1 => {
+            label.add_css_class("column-protocol");
+            label.set_halign(Align::Start);
+        }
+        2 | 3 => {
+            label.add_css_class("column-address");
+            label.set_halign(Align::Start);
+        }
+        4 => {
+            label.add_css_class("column-status");
+            label.set_halign(Align::Start);
+        }
+        TX_COLUMN | RX_COLUMN => {
+            label.add_css_class("column-rate");
+            label.set_halign(Align::End);
+            label.set_xalign(1.0);
+        }
+        PATH_COLUMN => {
+            label.add_css_class("caption");
+            label.add_css_class("dim-label");
+            label.add_css_class("column-path");
+            label.set_halign(Align::Start);
+        }
+        _ => {
+            label.set_halign(Align::Start);
+        }
+    }
+    label.add_css_class("table-cell");
+
+    // Add right-click gesture for context menu
+    let right_click_gesture = gtk::GestureClick::new();
+    right_click_gesture.set_button(3);
+
+    let active_popovers = active_popovers.clone();
+    right_click_gesture.connect_pressed(move |gesture, _, x, y| {
+        let copy_text = match gesture.widget().and_downcast::<Label>() {
+            Some(label) => label.text(),
+            None => return,
+        };
+
+        if let Some(display) = gtk::gdk::Display::default() {
+            let clipboard = display.clipboard();
+            clipboard.set_text(&copy_text);
+        } else {
+            eprintln!("Warning: Could not access clipboard - display not available");
+        }
+
+        let menu = PopoverMenu::builder().build();
+        let menu_model = Menu::new();
+        menu_model.append(Some("Copied!"), None);
+        menu.set_menu_model(Some(&menu_model));
+
+        if let Some(parent) = gesture.widget() {
+            menu.set_parent(&parent);
+            let rect = gtk::gdk::Rectangle::new(x as i32, y as i32, 1, 1);
+            menu.set_pointing_to(Some(&rect));
+
+            active_popovers.borrow_mut().push(menu.clone());
+
+            let menu_for_timeout = menu.clone();
+            let active_popovers_for_timeout = active_popovers.clone();
+            glib::timeout_add_seconds_local_once(1, move || {
+                menu_for_timeout.unparent();
+                let mut popovers = active_popovers_for_timeout.borrow_mut();
+                popovers.retain(|p| !p.eq(&menu_for_timeout));
+            });
+
+            menu.popup();
+        }
+    });
+    label.add_controller(right_click_gesture);
+
+    // Add keyboard shortcut for Ctrl+C
+    let key_controller = gtk::EventControllerKey::new();
+    key_controller.connect_key_pressed(move |controller, key, _, modifier| {
+        if key == gtk::gdk::Key::c && modifier == gtk::gdk::ModifierType::CONTROL_MASK {
+            let Some(label) = controller.widget().and_downcast::<Label>() else {
+                return glib::Propagation::Proceed;
+            };
+            if let Some(display) = gtk::gdk::Display::default() {
+                let clipboard = display.clipboard();
+                clipboard.set_text(&label.text());
+            } else {
+                eprintln!("Warning: Could not access clipboard - display not available");
+            }
+            return glib::Propagation::Stop;
+        }
+        glib::Propagation::Proceed
+    });
+    label.add_controller(key_controller);
+
+    label
+}
+
+/// Fill a recycled cell label with the value of column `col` for `row`
+fn bind_cell(label: &Label, col: usize, row: &ConnectionRow) {
+    let text = row.cells.get(col).map_or("", String::as_str);
+    if label.text().as_str() != text {
+        label.set_text(text);
+    }
+
+    let conn = &row.connection;
+    // Update dynamic styling, only touching classes that change
+    match col {
+        1 => {
+            // Protocol color
+            let wanted = match conn.protocol.as_str() {
+                "tcp" => "success",
+                "udp" => "warning",
+                _ => "dim-label",
+            };
+            set_state_class(label, &["success", "warning", "dim-label"], wanted);
+        }
+        3 => {
+            // Destination rate color
+            let wanted = if conn.is_active() {
+                "accent"
+            } else {
+                "dim-label"
+            };
+            set_state_class(label, &["accent", "dim-label"], wanted);
+        }
+        4 => {
+            // Status color
+            let wanted = match conn.state.as_str() {
+                "ESTABLISHED" => "success",
+                "LISTEN" => "warning",
+                "TIME_WAIT" => "error",
+                _ => "dim-label",
+            };
+            set_state_class(label, &["success", "warning", "error", "dim-label"], wanted);
+        }
+        TX_COLUMN => {
+            // TX Rate color
+            let wanted = if conn.tx_rate > 0 {
+                "error"
+            } else {
+                "dim-label"
+            };
+            set_state_class(label, &["error", "dim-label"], wanted);
+        }
+        RX_COLUMN => {
+            // RX Rate color
+            let wanted = if conn.rx_rate > 0 {
+                "accent"
+            } else {
+                "dim-label"
+            };
+            set_state_class(label, &["accent", "dim-label"], wanted);
+        }
+        _ => {}
+    }
+}
+
+/// Wrap a row comparison as a sorter over the store's boxed rows
+fn row_sorter(
+    compare: impl Fn(&ConnectionRow, &ConnectionRow) -> Ordering + 'static,
+) -> CustomSorter {
+    CustomSorter::new(move |a, b| {
+        let (Some(a), Some(b)) = (
+            a.downcast_ref::<BoxedAnyObject>(),
+            b.downcast_ref::<BoxedAnyObject>(),
+        ) else {
+            return gtk::Ordering::Equal;
+        };
+        let (a, b): (Ref<ConnectionRow>, Ref<ConnectionRow>) = (a.borrow(), b.borrow());
+        compare(&a, &b).into()
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_refresh_backoff_doubles_up_to_cap() {
+        let mut backoff = RefreshBackoff::new();
+        assert_eq!(
+            backoff.observe(1, 0, false),
+            MIN_REFRESH_SECS,
+            "first fingerprint is a change"
+        );
+
+        let mut intervals = Vec::new();
+        for _ in 0..8 {
+            intervals.push(backoff.observe(1, 0, false));
+        }
+        assert_eq!(intervals, [3, 6, 6, 12, 12, 15, 15, 15]);
+    }
+
+    #[test]
+    fn test_refresh_backoff_resets_on_change() {
+        let mut backoff = RefreshBackoff::new();
+        for _ in 0..8 {
+            backoff.observe(1, 0, false);
+        }
+        assert_eq!(backoff.interval, MAX_REFRESH_SECS);
+
+        assert_eq!(backoff.observe(2, 0, false), MIN_REFRESH_SECS);
+        for _ in 0..8 {
+            backoff.observe(2, 0, false);
+        }
+        assert_eq!(
+            backoff.observe(2, 0, true),
+            MIN_REFRESH_SECS,
+            "traffic resets too"
+        );
+        assert_eq!(backoff.idle_refreshes, 0);
+    }
+
+    #[test]
+    fn test_refresh_backoff_resets_on_new_lookups() {
+        let mut backoff = RefreshBackoff::new();
+        for _ in 0..8 {
+            backoff.observe(1, 0, false);
+        }
+        assert_eq!(backoff.interval, MAX_REFRESH_SECS);
+
+        assert_eq!(
+            backoff.observe(1, 1, false),
+            MIN_REFRESH_SECS,
+            "a resolver generation bump is a change"
+        );
+        assert_eq!(backoff.observe(1, 1, false), MIN_REFRESH_SECS);
+        assert_eq!(backoff.observe(1, 1, false), 2 * MIN_REFRESH_SECS);
+
+        backoff.reset();
+        assert_eq!(backoff.interval, MIN_REFRESH_SECS);
+        assert_eq!(backoff.idle_refreshes, 0);
+    }
 }
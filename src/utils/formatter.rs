@@ -1,43 +1,48 @@
 pub struct Formatter;
 
+const RATE_UNITS: [&str; 5] = ["B", "KB", "MB", "GB", "TB"];
+/// Units for `format_bytes_precise`, which goes one step further than rates
+const PRECISE_UNITS: [&str; 6] = ["B", "KB", "MB", "GB", "TB", "PB"];
+/// Index of MB, the largest unit used for transfer totals
+const TOTAL_MAX_UNIT: usize = 2;
+
+/// Index of the largest 1024-based unit not exceeding `bytes_val`, capped at
+/// `max_index`. Derived from the position of the highest set bit instead of
+/// dividing by 1024 in a loop.
+fn unit_index(bytes_val: u64, max_index: usize) -> usize {
+    let index = bytes_val.checked_ilog2().unwrap_or(0) / 10;
+    (index as usize).min(max_index)
+}
+
+fn scale(bytes_val: u64, index: usize) -> f64 {
+    bytes_val as f64 / (1u64 << (10 * index)) as f64
+}
+
 impl Formatter {
     pub fn format_bytes(bytes_val: u64) -> String {
-        let mut bytes_val = bytes_val as f64;
-        let units = ["B", "KB", "MB", "GB"];
-
-        for unit in &units {
-            if bytes_val < 1024.0 {
-                return format!("{bytes_val:.1}{unit}/s");
-            }
-            bytes_val /= 1024.0;
-        }
-        format!("{bytes_val:.1}TB/s")
+        let index = unit_index(bytes_val, RATE_UNITS.len() - 1);
+        format!("{:.1}{}/s", scale(bytes_val, index), RATE_UNITS[index])
     }
 
+    /// Totals stop at MB, which gets one extra decimal
     pub fn format_bytes_total(bytes_val: u64) -> String {
-        let bytes_val = bytes_val as f64;
-
-        if bytes_val < 1024.0 {
-            format!("{bytes_val:.1} B")
-        } else if bytes_val < 1024.0 * 1024.0 {
-            format!("{:.1} KB", bytes_val / 1024.0)
-        } else {
-            format!("{:.2} MB", bytes_val / (1024.0 * 1024.0))
-        }
+        let index = unit_index(bytes_val, TOTAL_MAX_UNIT);
+        let precision = if index == TOTAL_MAX_UNIT { 2 } else { 1 };
+        format!(
+            "{:.precision$} {}",
+            scale(bytes_val, index),
+            RATE_UNITS[index]
+        )
     }
 
     #[allow(dead_code)]
     pub fn format_bytes_precise(bytes_val: u64, precision: usize) -> String {
-        let mut bytes_val = bytes_val as f64;
-        let units = ["B", "KB", "MB", "GB", "TB"];
-
-        for unit in &units {
-            if bytes_val < 1024.0 {
-                return format!("{bytes_val:.precision$}{unit}/s", precision = precision);
-            }
-            bytes_val /= 1024.0;
-        }
-        format!("{bytes_val:.precision$}PB/s", precision = precision)
+        let index = unit_index(bytes_val, PRECISE_UNITS.len() - 1);
+        format!(
+            "{:.precision$}{}/s",
+            scale(bytes_val, index),
+            PRECISE_UNITS[index]
+        )
     }
 
     #[allow(dead_code)]
@@ -160,6 +165,9 @@ mod tests {
         assert_eq!(format_bytes(1536), "1.5KB/s");
         assert_eq!(format_bytes(1024 * 1024), "1.0MB/s");
         assert_eq!(format_bytes(1024 * 1024 * 1024), "1.0GB/s");
+        assert_eq!(format_bytes(1024 * 1024 - 1), "1024.0KB/s");
+        assert_eq!(format_bytes(1 << 40), "1.0TB/s");
+        assert_eq!(format_bytes(1 << 50), "1024.0TB/s");
     }
 
     #[test]
@@ -168,7 +176,9 @@ mod tests {
         assert_eq!(format_bytes_total(512), "512.0 B");
         assert_eq!(format_bytes_total(1024), "1.0 KB");
         assert_eq!(format_bytes_total(1536), "1.5 KB");
+        assert_eq!(format_bytes_total(1024 * 1024 - 1), "1024.0 KB");
         assert_eq!(format_bytes_total(1024 * 1024), "1.00 MB");
+        assert_eq!(format_bytes_total(1 << 30), "1024.00 MB");
     }
 
     #[test]
@@ -232,5 +242,8 @@ mod tests {
     fn test_format_bytes_precise() {
         assert_eq!(Formatter::format_bytes_precise(1024, 2), "1.00KB/s");
         assert_eq!(Formatter::format_bytes_precise(1536, 3), "1.500KB/s");
+        assert_eq!(Formatter::format_bytes_precise(512, 0), "512B/s");
+        assert_eq!(Formatter::format_bytes_precise(1 << 50, 1), "1.0PB/s");
+        assert_eq!(Formatter::format_bytes_precise(1 << 60, 1), "1024.0PB/s");
     }
 }